@@ -1,20 +1,70 @@
 from __future__ import annotations
 
+import calendar
+import re
+import sys
+import time
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-from daily_movers.config import load_config
+from pydantic import BaseModel, BeforeValidator, ConfigDict, TypeAdapter, ValidationError, model_validator
+
+from daily_movers.config import MOVERS_SOURCES, REGIONS, RUN_MODES, AppConfig, load_config
 from daily_movers.errors import DailyMoversError
-from daily_movers.pipeline.orchestrator import RunRequest, run_daily_movers as run_pipeline
 
+if TYPE_CHECKING:
+    from daily_movers.pipeline.orchestrator import RunRequest, run_daily_movers as run_pipeline
+
+
+def __getattr__(name: str) -> Any:
+    # The orchestrator pulls in requests/openpyxl/bs4, so it is imported only
+    # once a request has passed validation. Resolving the names here keeps
+    # them visible (and patchable) as module attributes.
+    if name in {"RunRequest", "run_pipeline"}:
+        from daily_movers.pipeline import orchestrator
+
+        globals().setdefault("RunRequest", orchestrator.RunRequest)
+        globals().setdefault("run_pipeline", orchestrator.run_daily_movers)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_ALLOWED_MODES = set(RUN_MODES)
+_ALLOWED_REGIONS = set(REGIONS)
+_ALLOWED_SOURCES = set(MOVERS_SOURCES)
 
-_ALLOWED_MODES = {"movers", "watchlist"}
-_ALLOWED_REGIONS = {"us", "il", "uk", "eu", "crypto"}
-_ALLOWED_SOURCES = {"auto", "most-active", "universe"}
+# Error messages are built once; they are part of the adapter contract.
+_MODE_ERROR = f"mode must be one of {sorted(_ALLOWED_MODES)}"
+_REGION_ERROR = f"region must be one of {sorted(_ALLOWED_REGIONS)}"
+_SOURCE_ERROR = f"source must be one of {sorted(_ALLOWED_SOURCES)}"
+
+# Normalized input -> canonical value. Returning the table's own string means
+# validated requests share interned constants instead of per-call copies.
+_MODE_TABLE = {m: m for m in _ALLOWED_MODES}
+_REGION_TABLE = {r: r for r in _ALLOWED_REGIONS}
+_SOURCE_TABLE = {s: s for s in _ALLOWED_SOURCES}
+
+# How long a successful watchlist existence probe is reused across adapter calls.
+_WATCHLIST_PROBE_TTL_SECONDS = 5
+_WATCHLIST_PROBE_CACHE_SIZE = 128
+
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "off", ""})
 
 
 def _coerce_iso_date(value: Any) -> str:
+    # Fast path: the CLI and most workflows already pass a canonical
+    # YYYY-MM-DD string, which only needs a calendar check (no date object).
+    if isinstance(value, str):
+        match = _ISO_DATE_RE.fullmatch(value.strip())
+        if match:
+            year, month, day = (int(part) for part in match.groups())
+            if year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return match.group(0)
+            raise ValueError("date must be a YYYY-MM-DD string")
     if value is None or (isinstance(value, str) and not value.strip()):
         return date.today().isoformat()
     if isinstance(value, date):
@@ -28,6 +78,8 @@ def _coerce_iso_date(value: Any) -> str:
 
 
 def _coerce_int(value: Any, *, field: str) -> int:
+    if type(value) is int:
+        return value
     if isinstance(value, bool):
         raise ValueError(f"{field} must be an integer")
     try:
@@ -48,9 +100,9 @@ def _coerce_bool(value: Any, *, field: str) -> bool:
         raise ValueError(f"{field} must be a boolean")
     if isinstance(value, str):
         v = value.strip().lower()
-        if v in {"true", "1", "yes", "y", "on"}:
+        if v in _TRUE_STRINGS:
             return True
-        if v in {"false", "0", "no", "n", "off", ""}:
+        if v in _FALSE_STRINGS:
             return False
         raise ValueError(f"{field} must be a boolean")
     raise ValueError(f"{field} must be a boolean")
@@ -67,6 +119,102 @@ def _coerce_optional_path(value: Any) -> str | None:
     raise ValueError("watchlist must be a path string")
 
 
+# path -> monotonic deadline. Only hits are remembered, so a watchlist that
+# appears between calls is picked up on the very next probe.
+_watchlist_seen: dict[str, float] = {}
+
+
+def _watchlist_exists(path: str) -> bool:
+    now = time.monotonic()
+    deadline = _watchlist_seen.get(path)
+    if deadline is not None and deadline > now:
+        return True
+    if not Path(path).exists():
+        _watchlist_seen.pop(path, None)
+        return False
+    if len(_watchlist_seen) >= _WATCHLIST_PROBE_CACHE_SIZE:
+        _watchlist_seen.clear()
+    _watchlist_seen[path] = now + _WATCHLIST_PROBE_TTL_SECONDS
+    return True
+
+
+def _coerce_out_dir(value: Any) -> str:
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("out_dir must be a non-empty string")
+    return value
+
+
+def _choice(table: dict[str, str], message: str):  # noqa: ANN202
+    def _validate(value: Any) -> str:
+        if isinstance(value, str):
+            key = value.strip().lower()
+        else:
+            key = str(value).strip().lower() if value is not None else ""
+        try:
+            return table[key]
+        except KeyError:
+            raise ValueError(message) from None
+
+    return _validate
+
+
+def _positive_top(value: Any) -> int:
+    parsed = _coerce_int(value, field="top")
+    if parsed <= 0:
+        raise ValueError("top must be a positive integer")
+    return parsed
+
+
+class AdapterRequest(BaseModel):
+    """Validated adapter inputs (UiPath frequently passes everything as strings)."""
+
+    model_config = ConfigDict(extra="forbid", validate_default=True)
+
+    out_dir: Annotated[str, BeforeValidator(_coerce_out_dir)]
+    date: Annotated[str, BeforeValidator(_coerce_iso_date)] = None  # type: ignore[assignment]
+    mode: Annotated[
+        Literal["movers", "watchlist"],
+        BeforeValidator(_choice(_MODE_TABLE, _MODE_ERROR)),
+    ] = "movers"
+    region: Annotated[
+        Literal["us", "il", "uk", "eu", "crypto"],
+        BeforeValidator(_choice(_REGION_TABLE, _REGION_ERROR)),
+    ] = "us"
+    source: Annotated[
+        Literal["auto", "most-active", "universe"],
+        BeforeValidator(_choice(_SOURCE_TABLE, _SOURCE_ERROR)),
+    ] = "auto"
+    top: Annotated[int, BeforeValidator(_positive_top)] = 20
+    watchlist: Annotated[str | None, BeforeValidator(_coerce_optional_path)] = None
+    send_email: Annotated[bool, BeforeValidator(lambda v: _coerce_bool(v, field="send_email"))] = False
+
+    @model_validator(mode="after")
+    def _watchlist_matches_mode(self) -> AdapterRequest:
+        if self.mode == "watchlist":
+            if not self.watchlist:
+                raise ValueError("watchlist is required when mode='watchlist'")
+            if not _watchlist_exists(self.watchlist):
+                raise ValueError(f"watchlist path not found: {self.watchlist}")
+        elif self.watchlist:
+            raise ValueError("watchlist must be omitted when mode='movers'")
+        return self
+
+
+# Built once at import so each adapter call reuses the compiled validator.
+_ADAPTER: TypeAdapter[AdapterRequest] = TypeAdapter(AdapterRequest)
+_ADAPTER_FIELDS = frozenset(AdapterRequest.model_fields)
+
+
+def _validation_message(exc: ValidationError) -> str:
+    """Unwrap the first validator error so callers see our message verbatim."""
+    first = exc.errors()[0]
+    inner = (first.get("ctx") or {}).get("error")
+    if inner is not None:
+        return str(inner)
+    field = ".".join(str(part) for part in first.get("loc", ()))
+    return f"{field}: {first.get('msg')}" if field else str(first.get("msg"))
+
+
 def run_daily_movers_adapter(
     out_dir: str,
     *,
@@ -83,49 +231,63 @@ def run_daily_movers_adapter(
     Strictly validates/coerces inputs (UiPath frequently passes strings) and returns
     a JSON-serializable payload with stable keys: {status, summary, paths}.
     """
+    return _run_adapter_request(
+        {
+            "out_dir": out_dir,
+            "date": date,
+            "mode": mode,
+            "region": region,
+            "source": source,
+            "top": top,
+            "watchlist": watchlist,
+            "send_email": send_email,
+        },
+        config=None,
+    )
+
+
+def run_daily_movers_batch(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run several adapter requests against a single loaded AppConfig.
+
+    Preferred when a robot handles multiple regions/dates in one job. Each item
+    takes the same keys as run_daily_movers_adapter (out_dir is required).
+    Results are returned in input order; a failing item yields a "failed"
+    payload without stopping the rest of the batch.
+    """
+    # Reject malformed items before running anything, mirroring the TypeError
+    # the single-call entrypoint raises for unknown parameters.
+    for idx, item in enumerate(requests):
+        unknown = set(item) - _ADAPTER_FIELDS
+        if unknown:
+            raise TypeError(f"batch item {idx} has unknown parameters: {sorted(unknown)}")
+        if "out_dir" not in item:
+            raise TypeError(f"batch item {idx} is missing required parameter 'out_dir'")
+
+    cfg = load_config()
+    return [_run_adapter_request(item, config=cfg) for item in requests]
+
+
+def _run_adapter_request(raw: dict[str, Any], *, config: AppConfig | None) -> dict[str, Any]:
     try:
-        if not isinstance(out_dir, str) or not out_dir.strip():
-            raise ValueError("out_dir must be a non-empty string")
-
-        normalized_date = _coerce_iso_date(date)
-        normalized_mode = str(mode).strip().lower() if mode is not None else ""
-        normalized_region = str(region).strip().lower() if region is not None else ""
-        normalized_source = str(source).strip().lower() if source is not None else ""
-        normalized_top = _coerce_int(top, field="top")
-        normalized_watchlist = _coerce_optional_path(watchlist)
-        normalized_send_email = _coerce_bool(send_email, field="send_email")
-
-        if normalized_mode not in _ALLOWED_MODES:
-            raise ValueError(f"mode must be one of {sorted(_ALLOWED_MODES)}")
-        if normalized_region not in _ALLOWED_REGIONS:
-            raise ValueError(f"region must be one of {sorted(_ALLOWED_REGIONS)}")
-        if normalized_source not in _ALLOWED_SOURCES:
-            raise ValueError(f"source must be one of {sorted(_ALLOWED_SOURCES)}")
-        if normalized_top <= 0:
-            raise ValueError("top must be a positive integer")
-
-        if normalized_mode == "watchlist":
-            if not normalized_watchlist:
-                raise ValueError("watchlist is required when mode='watchlist'")
-            if not Path(normalized_watchlist).exists():
-                raise ValueError(f"watchlist path not found: {normalized_watchlist}")
-        else:
-            if normalized_watchlist:
-                raise ValueError("watchlist must be omitted when mode='movers'")
-
-        cfg = load_config()
-        request = RunRequest(
-            date=normalized_date,
-            mode=normalized_mode,
-            region=normalized_region,
-            source=normalized_source,
-            top=normalized_top,
-            watchlist=normalized_watchlist,
-            out_dir=out_dir,
-            send_email=normalized_send_email,
+        try:
+            validated = _ADAPTER.validate_python(raw)
+        except ValidationError as exc:
+            raise ValueError(_validation_message(exc)) from exc
+
+        cfg = config or load_config()
+        module = sys.modules[__name__]
+        request = module.RunRequest(
+            date=validated.date,
+            mode=validated.mode,
+            region=validated.region,
+            source=validated.source,
+            top=validated.top,
+            watchlist=validated.watchlist,
+            out_dir=validated.out_dir,
+            send_email=validated.send_email,
         )
 
-        artifacts = run_pipeline(request=request, config=cfg)
+        artifacts = module.run_pipeline(request=request, config=cfg)
         payload = artifacts.model_dump()
         return {
             "status": payload["status"],
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import subprocess
 import sys
-import webbrowser
 from datetime import date
 from pathlib import Path
 
-from daily_movers.config import load_config
+from daily_movers.config import MOVERS_SOURCES, REGIONS, RUN_MODES, load_config
 from daily_movers.pipeline.orchestrator import RunRequest, run_daily_movers
 
 
@@ -16,16 +17,16 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command")
 
     run_parser = subparsers.add_parser("run", help="Run daily movers pipeline")
-    run_parser.add_argument("--date", default=date.today().isoformat(), help="report date label (YYYY-MM-DD)")
-    run_parser.add_argument("--mode", choices=["movers", "watchlist"], default="movers")
+    run_parser.add_argument("--date", default=None, help="report date label (YYYY-MM-DD, default: today)")
+    run_parser.add_argument("--mode", choices=RUN_MODES, default="movers")
     run_parser.add_argument(
         "--source",
-        choices=["auto", "most-active", "universe"],
+        choices=MOVERS_SOURCES,
         default="auto",
         help="movers source selector (auto=region default; most-active=Yahoo most_actives screener; universe=static universe)",
     )
     run_parser.add_argument("--top", type=int, default=20)
-    run_parser.add_argument("--region", choices=["us", "il", "uk", "eu", "crypto"], default="us")
+    run_parser.add_argument("--region", choices=REGIONS, default="us")
     run_parser.add_argument("--watchlist", default=None, help="path to watchlist YAML/JSON")
     run_parser.add_argument("--out", default=None, help="output run directory")
     run_parser.add_argument("--send-email", action="store_true", help="send email when SMTP is configured")
@@ -34,46 +35,69 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="do not auto-open digest.html in your default browser",
     )
+    run_parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="skip writing archive.jsonl (per-ticker records for replay)",
+    )
 
     return parser
 
 
+# Singleton parser (built once per process; parse_args does not mutate it)
+_parser: argparse.ArgumentParser | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    global _parser
+    if _parser is None:
+        _parser = build_parser()
+    return _parser
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint.
 
     Parses args, builds a RunRequest, runs the orchestrator, prints the artifact
     paths as JSON, and (by default) opens the HTML digest in a browser.
     """
-    parser = build_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     if args.command != "run":
         parser.print_help()
         return 1
 
-    out = args.out or f"runs/{args.date}"
+    # Resolved per call (not as a parser default) so the cached parser never
+    # hands out a stale date in a long-lived process.
+    run_date = args.date or date.today().isoformat()
+    out = args.out or f"runs/{run_date}"
 
     cfg = load_config()
     request = RunRequest(
-        date=args.date,
+        date=run_date,
         mode=args.mode,
         region=args.region,
         source=args.source,
         top=args.top,
         watchlist=args.watchlist,
         out_dir=out,
-        send_email=bool(args.send_email),
+        send_email=args.send_email,
+        write_archive=not args.no_archive,
     )
     artifacts = run_daily_movers(request=request, config=cfg)
-    print(json.dumps(artifacts.model_dump(), indent=2, ensure_ascii=True))
+    payload = artifacts.model_dump()
+    print(json.dumps(payload, indent=2, ensure_ascii=True))
     if not args.no_open:
-        _open_digest_html(artifacts.paths.get("digest_html"))
+        _open_digest_html(payload["paths"].get("digest_html"))
     return 0
 
 
 def _open_digest_html(path: str | None) -> None:
     """Best-effort: open digest.html in the default browser.
 
+    Hands the file straight to the OS opener so we skip webbrowser's probe of
+    candidate browsers; webbrowser remains the fallback when no opener exists.
     Failure to open is not fatal; the artifact is still written to disk.
     """
     if not path:
@@ -81,10 +105,38 @@ def _open_digest_html(path: str | None) -> None:
     html_path = Path(path)
     if not html_path.exists():
         return
+    if not html_path.is_absolute():
+        html_path = html_path.resolve()
+
+    try:
+        _launch_default_app(html_path)
+        return
+    except OSError:
+        pass
+
+    # Imported here: only auto-open needs it, so `--no-open` runs (e.g. UiPath
+    # robots) skip its import cost.
+    import webbrowser
+
     try:
-        webbrowser.open(html_path.resolve().as_uri(), new=2)
+        webbrowser.open(html_path.as_uri(), new=2)
     except Exception as exc:  # noqa: BLE001
         print(
             f"[daily_movers] unable to auto-open digest: {exc}",
             file=sys.stderr,
         )
+
+
+def _launch_default_app(path: Path) -> None:
+    """Open path with the platform's default handler (raises OSError if missing)."""
+    if sys.platform == "win32":
+        os.startfile(path)  # type: ignore[attr-defined]
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    subprocess.Popen(
+        [opener, str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
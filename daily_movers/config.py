@@ -8,37 +8,56 @@ Design:
 - Environment variables always override .env file values.
 """
 
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 # Small curated universes for non-US regions (used when Yahoo screener isn't
 # available or when --source=universe is explicitly requested).
-REGION_UNIVERSES: dict[str, list[str]] = {
-    "us": [
-        "AAPL",
-        "MSFT",
-        "NVDA",
-        "AMZN",
-        "TSLA",
-        "META",
-        "GOOGL",
-        "AMD",
-        "PLTR",
-        "INTC",
-        "SOFI",
-        "NIO",
-    ],
-    "il": ["TEVA.TA", "NICE.TA", "ICL.TA", "DSCT.TA", "POLI.TA", "LUMI.TA"],
-    "uk": ["BP.L", "HSBA.L", "VOD.L", "BARC.L", "AZN.L", "SHEL.L"],
-    "eu": ["ASML.AS", "SAN.PA", "BMW.DE", "SIE.DE", "AIR.PA", "OR.PA"],
-    "crypto": ["BTC-USD", "ETH-USD", "SOL-USD", "XRP-USD", "DOGE-USD", "BNB-USD"],
-}
+REGION_UNIVERSES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "us": (
+            "AAPL",
+            "MSFT",
+            "NVDA",
+            "AMZN",
+            "TSLA",
+            "META",
+            "GOOGL",
+            "AMD",
+            "PLTR",
+            "INTC",
+            "SOFI",
+            "NIO",
+        ),
+        "il": ("TEVA.TA", "NICE.TA", "ICL.TA", "DSCT.TA", "POLI.TA", "LUMI.TA"),
+        "uk": ("BP.L", "HSBA.L", "VOD.L", "BARC.L", "AZN.L", "SHEL.L"),
+        "eu": ("ASML.AS", "SAN.PA", "BMW.DE", "SIE.DE", "AIR.PA", "OR.PA"),
+        "crypto": ("BTC-USD", "ETH-USD", "SOL-USD", "XRP-USD", "DOGE-USD", "BNB-USD"),
+    }
+)
+
+# Option values shared by the CLI, the UiPath adapter, and ingestion.
+RUN_MODES: tuple[str, ...] = ("movers", "watchlist")
+REGIONS: tuple[str, ...] = tuple(REGION_UNIVERSES)
+MOVERS_SOURCES: tuple[str, ...] = ("auto", "most-active", "universe")
 
 
 class AppConfig(BaseModel):
+    # Frozen: load_config hands the same cached instance to every caller, so
+    # use model_copy(update=...) to derive a variant instead of assigning.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     # HTTP cache settings (Yahoo endpoints can be slow/flaky)
     cache_dir: Path = Path(".cache/http")
     cache_ttl_seconds: int = 1800  # 30 minutes
@@ -86,57 +105,111 @@ class AppConfig(BaseModel):
             raise ValueError("port must be in 1..65535")
         return value
 
+    # Readiness flags are derived once per instance; the config is frozen so
+    # they can only change through model_copy, which recomputes them.
+    _openai_enabled: bool = PrivateAttr(default=False)
+    _smtp_ready: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._refresh_flags()
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> AppConfig:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._refresh_flags()
+        return copied
+
+    def _refresh_flags(self) -> None:
+        self._openai_enabled = bool(self.openai_api_key)
+        self._smtp_ready = bool(
+            self.smtp_host
+            and self.smtp_username
+            and self.smtp_password
+            and self.from_email
+            and self.self_email
+        )
+
     @property
     def openai_enabled(self) -> bool:
-        return bool(self.openai_api_key)
+        return self._openai_enabled
 
     @property
     def smtp_ready(self) -> bool:
-        required = [
-            self.smtp_host,
-            self.smtp_username,
-            self.smtp_password,
-            self.from_email,
-            self.self_email,
-        ]
-        return all(bool(v) for v in required)
+        return self._smtp_ready
+
+# Environment variable -> AppConfig field, with the default used when the
+# variable is unset or empty (None leaves the optional field unset). Pydantic
+# coerces the numeric/path fields from their string values.
+_ENV_SPEC: tuple[tuple[str, str, str | None], ...] = (
+    ("OPENAI_API_KEY", "openai_api_key", None),
+    ("ANALYSIS_MODEL", "analysis_model", "gpt-4o-mini"),
+    ("OPENAI_BASE_URL", "openai_base_url", "https://api.openai.com/v1"),
+    ("SMTP_HOST", "smtp_host", "smtp.gmail.com"),
+    ("SMTP_PORT", "smtp_port", "587"),
+    ("SMTP_SSL_PORT", "smtp_ssl_port", "465"),
+    ("SMTP_USERNAME", "smtp_username", None),
+    ("SMTP_PASSWORD", "smtp_password", None),
+    ("FROM_EMAIL", "from_email", None),
+    ("SELF_EMAIL", "self_email", None),
+    ("CACHE_DIR", "cache_dir", ".cache/http"),
+    ("CACHE_TTL_SECONDS", "cache_ttl_seconds", "1800"),
+    ("MAX_WORKERS", "max_workers", "5"),
+    ("MAX_REQUESTS_PER_HOST", "max_requests_per_host", "5"),
+    ("REQUEST_TIMEOUT_SECONDS", "request_timeout_seconds", "20"),
+    ("OPENAI_TIMEOUT_SECONDS", "openai_timeout_seconds", "45"),
+    ("LOG_LEVEL", "log_level", "INFO"),
+)
+
+# A SHA-256 fingerprint of these variables' values is the cache key for
+# _build_config, so any change in the shell environment (or a re-loaded .env)
+# yields a fresh AppConfig. Hashing keeps OPENAI_API_KEY / SMTP_PASSWORD out
+# of long-lived cache keys.
+_RELEVANT_KEYS: tuple[str, ...] = tuple(name for name, _, _ in _ENV_SPEC)
+_CONFIG_CACHE_SIZE = 4
+_config_cache: OrderedDict[str, AppConfig] = OrderedDict()
+_config_cache_lock = Lock()
 
 
 def load_config(env_file: str | None = ".env") -> AppConfig:
+    """Return the AppConfig for the current environment.
+
+    Repeated calls (e.g. a UiPath robot invoking the adapter in a loop) reuse
+    the cached .env parse and AppConfig instance as long as the .env mtime and
+    the relevant environment variables are unchanged.
+    """
     if env_file:
         # Load .env values but let shell environment variables win
         # (important for scripts that set SMTP_* before calling the CLI)
-        load_dotenv(env_file, override=False)
-    return AppConfig(
-        openai_api_key=_getenv_opt("OPENAI_API_KEY"),
-        analysis_model=_getenv_str("ANALYSIS_MODEL", "gpt-4o-mini"),
-        openai_base_url=_getenv_str("OPENAI_BASE_URL", "https://api.openai.com/v1"),
-        smtp_host=_getenv_str("SMTP_HOST", "smtp.gmail.com"),
-        smtp_port=int(_getenv_str("SMTP_PORT", "587")),
-        smtp_ssl_port=int(_getenv_str("SMTP_SSL_PORT", "465")),
-        smtp_username=_getenv_opt("SMTP_USERNAME"),
-        smtp_password=_getenv_opt("SMTP_PASSWORD"),
-        from_email=_getenv_opt("FROM_EMAIL"),
-        self_email=_getenv_opt("SELF_EMAIL"),
-        cache_dir=Path(_getenv_str("CACHE_DIR", ".cache/http")),
-        cache_ttl_seconds=int(_getenv_str("CACHE_TTL_SECONDS", "1800")),
-        max_workers=int(_getenv_str("MAX_WORKERS", "5")),
-        max_requests_per_host=int(_getenv_str("MAX_REQUESTS_PER_HOST", "5")),
-        request_timeout_seconds=int(_getenv_str("REQUEST_TIMEOUT_SECONDS", "20")),
-        openai_timeout_seconds=int(_getenv_str("OPENAI_TIMEOUT_SECONDS", "45")),
-        log_level=_getenv_str("LOG_LEVEL", "INFO"),
-    )
-
-
-def _getenv_opt(name: str) -> str | None:
-    import os
-
-    value = os.getenv(name)
-    if value is None or value == "":
-        return None
-    return value
-
-
-def _getenv_str(name: str, default: str) -> str:
-    value = _getenv_opt(name)
-    return value if value is not None else default
+        _load_env_file(env_file, _env_file_mtime_ns(env_file))
+    return _build_config(tuple(os.environ.get(k, "") for k in _RELEVANT_KEYS))
+
+
+def _env_file_mtime_ns(env_file: str) -> int:
+    try:
+        return os.stat(env_file).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=4)
+def _load_env_file(env_file: str, mtime_ns: int) -> None:
+    load_dotenv(env_file, override=False)
+
+
+def _build_config(env_values: tuple[str, ...]) -> AppConfig:
+    fingerprint = hashlib.sha256("\0".join(env_values).encode("utf-8")).hexdigest()
+    with _config_cache_lock:
+        cached = _config_cache.get(fingerprint)
+        if cached is not None:
+            _config_cache.move_to_end(fingerprint)
+            return cached
+    kwargs = {
+        field: value or default
+        for (_, field, default), value in zip(_ENV_SPEC, env_values)
+    }
+    config = AppConfig(**kwargs)
+    with _config_cache_lock:
+        _config_cache[fingerprint] = config
+        while len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+    return config
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from email.message import EmailMessage
 from pathlib import Path
 
@@ -30,6 +31,45 @@ class EmlBackend:
         )
         return message
 
+    def build_messages(
+        self,
+        *,
+        subject: str,
+        html_body: str,
+        from_email: str,
+        to_emails: list[str],
+    ) -> list[EmailMessage]:
+        """Build one message per recipient, encoding the MIME body only once.
+
+        Each clone is a shallow copy of the first message, so the encoded parts
+        are shared and must be treated as read-only. ``del`` rebinds the
+        clone's header list, which keeps the To header from leaking between
+        copies (``replace_header`` would edit the shared list in place).
+        """
+        if not to_emails:
+            return []
+        first = build_digest_eml(
+            subject=subject,
+            html_body=html_body,
+            from_email=from_email,
+            to_email=to_emails[0],
+        )
+        messages = [first]
+        for to_email in to_emails[1:]:
+            clone = copy.copy(first)
+            del clone["To"]
+            clone["To"] = to_email
+            messages.append(clone)
+        self.logger.info(
+            "email_messages_built",
+            stage="email",
+            status="ok",
+            fallback_used=False,
+            from_email=from_email,
+            recipients=len(messages),
+        )
+        return messages
+
     def write_message(self, *, message: EmailMessage, out_path: Path) -> None:
         write_eml_file(message=message, out_path=out_path)
         self.logger.info(
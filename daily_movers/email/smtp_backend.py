@@ -2,24 +2,47 @@ from __future__ import annotations
 
 import smtplib
 import ssl
+from collections.abc import Iterable
 from email.message import EmailMessage
+from functools import lru_cache
+from typing import Literal
 
 from daily_movers.config import AppConfig
 from daily_movers.errors import EmailDeliveryError
 from daily_movers.storage.runs import StructuredLogger
 
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    # Loading the system CA bundle is expensive (notably on Windows), so the
+    # context is built once and shared by STARTTLS and SSL sends.
+    return ssl.create_default_context()
+
 
 class SmtpBackend:
-    """SMTP backend with STARTTLS primary and SSL fallback."""
+    """SMTP backend with STARTTLS primary and SSL fallback.
+
+    Whichever transport last succeeded is tried first on later sends.
+    """
 
     def __init__(self, *, config: AppConfig, logger: StructuredLogger) -> None:
         self.config = config
         self.logger = logger
+        # Transport that last delivered successfully; tried first next time so
+        # an SSL-only server does not cost a failed STARTTLS handshake per send.
+        self._preferred: Literal["starttls", "ssl"] | None = None
 
     def can_send(self) -> bool:
         return self.config.smtp_ready
 
     def send_message(self, *, message: EmailMessage) -> None:
+        self.send_messages(messages=[message])
+
+    def send_messages(self, *, messages: Iterable[EmailMessage]) -> None:
+        """Send several messages over one authenticated connection.
+
+        Transports are tried in _transport_order(); if one fails part-way, only
+        the messages not yet sent are retried on the next.
+        """
         if not self.can_send():
             raise EmailDeliveryError(
                 "SMTP configuration incomplete",
@@ -27,54 +50,85 @@ class SmtpBackend:
                 url=self.config.smtp_host,
             )
 
-        host = self.config.smtp_host
-        username = str(self.config.smtp_username)
-        password = str(self.config.smtp_password)
-
-        try:
-            with smtplib.SMTP(host, self.config.smtp_port, timeout=self.config.request_timeout_seconds) as server:
-                server.ehlo()
-                context = ssl.create_default_context()
-                server.starttls(context=context)
-                server.ehlo()
-                server.login(username, password)
-                server.send_message(message)
-            self.logger.info(
-                "email_sent_starttls",
-                stage="email",
-                status="ok",
-                url=f"smtp://{host}:{self.config.smtp_port}",
-            )
+        pending = list(messages)
+        if not pending:
             return
-        except Exception as starttls_exc:  # noqa: BLE001
-            self.logger.warning(
-                "email_starttls_failed",
-                stage="email",
-                error_type=starttls_exc.__class__.__name__,
-                error_message=str(starttls_exc),
-                url=f"smtp://{host}:{self.config.smtp_port}",
-            )
 
-        try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(
-                host,
-                self.config.smtp_ssl_port,
-                timeout=self.config.request_timeout_seconds,
-                context=context,
-            ) as server:
-                server.login(username, password)
-                server.send_message(message)
-            self.logger.info(
-                "email_sent_ssl",
-                stage="email",
-                status="ok",
-                url=f"smtps://{host}:{self.config.smtp_ssl_port}",
-            )
-            return
-        except Exception as ssl_exc:  # noqa: BLE001
-            raise EmailDeliveryError(
-                f"SMTP send failed on STARTTLS and SSL: {ssl_exc}",
-                stage="email",
-                url=host,
-            ) from ssl_exc
+        senders = {"starttls": self._send_starttls, "ssl": self._send_ssl}
+        last_exc: Exception | None = None
+        for transport in self._transport_order():
+            try:
+                senders[transport](pending)
+                self._preferred = transport
+                return
+            except Exception as exc:  # noqa: BLE001
+                last_exc = exc
+                self.logger.warning(
+                    f"email_{transport}_failed",
+                    stage="email",
+                    error_type=exc.__class__.__name__,
+                    error_message=str(exc),
+                    url=self._transport_url(transport),
+                )
+
+        tried = " and ".join(t.upper() for t in self._transport_order())
+        raise EmailDeliveryError(
+            f"SMTP send failed on {tried}: {last_exc}",
+            stage="email",
+            url=self.config.smtp_host,
+        ) from last_exc
+
+    def _transport_order(self) -> list[Literal["starttls", "ssl"]]:
+        if self.config.smtp_port == self.config.smtp_ssl_port:
+            # Both ports point at the implicit-TLS listener; STARTTLS cannot work.
+            return ["ssl"]
+        if self._preferred == "ssl":
+            return ["ssl", "starttls"]
+        return ["starttls", "ssl"]
+
+    def _transport_url(self, transport: str) -> str:
+        if transport == "ssl":
+            return f"smtps://{self.config.smtp_host}:{self.config.smtp_ssl_port}"
+        return f"smtp://{self.config.smtp_host}:{self.config.smtp_port}"
+
+    def _send_starttls(self, pending: list[EmailMessage]) -> None:
+        with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port, timeout=self.config.request_timeout_seconds) as server:
+            server.ehlo()
+            server.starttls(context=_ssl_context())
+            server.ehlo()
+            server.login(str(self.config.smtp_username), str(self.config.smtp_password))
+            sent = _drain(server, pending)
+        self.logger.info(
+            "email_sent_starttls",
+            stage="email",
+            status="ok",
+            url=self._transport_url("starttls"),
+            count=sent,
+        )
+
+    def _send_ssl(self, pending: list[EmailMessage]) -> None:
+        with smtplib.SMTP_SSL(
+            self.config.smtp_host,
+            self.config.smtp_ssl_port,
+            timeout=self.config.request_timeout_seconds,
+            context=_ssl_context(),
+        ) as server:
+            server.login(str(self.config.smtp_username), str(self.config.smtp_password))
+            sent = _drain(server, pending)
+        self.logger.info(
+            "email_sent_ssl",
+            stage="email",
+            status="ok",
+            url=self._transport_url("ssl"),
+            count=sent,
+        )
+
+
+def _drain(server: smtplib.SMTP, pending: list[EmailMessage]) -> int:
+    """Send and remove messages from the front of pending; return the count."""
+    sent = 0
+    while pending:
+        server.send_message(pending[0])
+        pending.pop(0)
+        sent += 1
+    return sent
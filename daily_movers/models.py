@@ -11,12 +11,16 @@ Hierarchy:
 All models use Pydantic for validation and serialization.
 """
 
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 import json
+import time
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 
 class Action(str, Enum):
@@ -29,7 +33,30 @@ class Action(str, Enum):
     SELL = "SELL"
 
 
-class ErrorInfo(BaseModel):
+# Member -> label. Enum .value goes through a Python-level descriptor; a dict
+# lookup on the (cached) member hash is several times cheaper per row.
+_ACTION_LABELS: dict[Action, str] = {action: action.value for action in Action}
+
+
+# defer_build: core schemas are built on first validation rather than at
+# import, so `--help`, test collection and importers that only need the types
+# don't pay for them.
+_DEFERRED = ConfigDict(defer_build=True)
+
+# Leaf models are never reassigned after construction, so they are frozen
+# (pydantic-core skips the setattr hook) and their sequence fields are tuples
+# with a shared empty default instead of a fresh list per instance.
+# Analysis, DecisionTrace and ReportRow stay mutable: the critic, agent and
+# HITL rules edit them in place.
+_FROZEN = ConfigDict(frozen=True, defer_build=True)
+
+
+# ErrorInfo and Headline are tiny, high-volume leaves built from values the
+# providers already hold as str. Slotted frozen dataclasses skip per-instance
+# validation; pydantic still validates them (from dicts) when they arrive
+# nested in model input, and dumps them as plain dicts.
+@dataclass(frozen=True, slots=True)
+class ErrorInfo:
     stage: str
     error_type: str
     error_message: str
@@ -37,19 +64,27 @@ class ErrorInfo(BaseModel):
     fallback_used: bool = False
 
 
-class Headline(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Headline:
     title: str
     url: str
     published_at: str | None = None
 
 
+# Constraints run inside pydantic-core instead of calling back into Python
+# validators for every row.
+Ticker = Annotated[str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=1)]
+
+
 class TickerRow(BaseModel):
     """Raw ingestion output for one ticker.
     
     Contains price/volume deltas and metadata. Failures during ingestion are
     captured in the errors list so the pipeline can continue.
     """
-    ticker: str
+    model_config = _FROZEN
+
+    ticker: Ticker
     name: str | None = None
     price: float | None = None
     abs_change: float | None = None
@@ -60,15 +95,7 @@ class TickerRow(BaseModel):
     market: str | None = None
     ingestion_source: str
     ingestion_fallback_used: bool = False
-    errors: list[ErrorInfo] = Field(default_factory=list)
-
-    @field_validator("ticker")
-    @classmethod
-    def _ticker_upper(cls, value: str) -> str:
-        v = value.strip().upper()
-        if not v:
-            raise ValueError("ticker cannot be empty")
-        return v
+    errors: tuple[ErrorInfo, ...] = ()
 
 
 class Enrichment(BaseModel):
@@ -77,17 +104,21 @@ class Enrichment(BaseModel):
     All fields are optional. Enrichment failures are recorded in errors but
     don't block the run.
     """
+    model_config = _FROZEN
+
     sector: str | None = None
     industry: str | None = None
     earnings_date: str | None = None
-    headlines: list[Headline] = Field(default_factory=list)
-    price_series: list[float] = Field(default_factory=list)
+    headlines: tuple[Headline, ...] = ()
+    price_series: tuple[float, ...] = ()
     open_price: float | None = None
     close_price: float | None = None
-    errors: list[ErrorInfo] = Field(default_factory=list)
+    errors: tuple[ErrorInfo, ...] = ()
 
 
 class DecisionTrace(BaseModel):
+    model_config = _DEFERRED
+
     evidence_used: list[Headline] = Field(default_factory=list)
     numeric_signals_used: dict[str, Any] = Field(default_factory=dict)
     rules_triggered: list[str] = Field(default_factory=list)
@@ -100,28 +131,44 @@ class Analysis(BaseModel):
     Produced by the analysis layer (LangGraph agent → OpenAI fallback → heuristics).
     Always includes explainability traces and provenance URLs for audit/debugging.
     """
+    model_config = _DEFERRED
+
     why_it_moved: str
-    sentiment: float
+    sentiment: float = Field(ge=-1.0, le=1.0)
     action: Action
-    confidence: float
+    confidence: float = Field(ge=0.0, le=1.0)
     decision_trace: DecisionTrace
     provenance_urls: list[str] = Field(default_factory=list)
     model_used: str = "heuristics"
     errors: list[ErrorInfo] = Field(default_factory=list)
 
-    @field_validator("sentiment")
-    @classmethod
-    def _sentiment_range(cls, value: float) -> float:
-        if value < -1 or value > 1:
-            raise ValueError("sentiment must be in [-1, 1]")
-        return value
 
-    @field_validator("confidence")
-    @classmethod
-    def _confidence_range(cls, value: float) -> float:
-        if value < 0 or value > 1:
-            raise ValueError("confidence must be in [0, 1]")
-        return value
+# json.dumps(..., ensure_ascii=True) builds a fresh JSONEncoder on every call
+# because of the non-default kwarg; to_flat_dict runs once per row, so reuse one.
+_SIGNALS_ENCODER = json.JSONEncoder(ensure_ascii=True)
+
+
+# Shared created_at for rows built during one pipeline batch. Formatting a
+# fresh UTC timestamp per row is measurable when a run builds many rows, and
+# rows from the same batch are expected to share a stamp anyway. A ContextVar
+# keeps concurrent runs (threads or tasks) from seeing each other's stamp;
+# worker threads must run inside a copied context to inherit it.
+_batch_ts_var: ContextVar[str | None] = ContextVar("daily_movers_batch_ts", default=None)
+
+
+def _batch_ts() -> str:
+    return _batch_ts_var.get() or utc_now_iso()
+
+
+@contextmanager
+def batch_timestamp(ts: str | None = None) -> Iterator[str]:
+    """Stamp every ReportRow created inside the block with one created_at."""
+    stamp = ts or utc_now_iso()
+    token = _batch_ts_var.set(stamp)
+    try:
+        yield stamp
+    finally:
+        _batch_ts_var.reset(token)
 
 
 class ReportRow(BaseModel):
@@ -129,6 +176,8 @@ class ReportRow(BaseModel):
     
     This is the final structure that gets rendered into HTML/Excel/JSONL.
     """
+    model_config = _DEFERRED
+
     ticker: TickerRow
     enrichment: Enrichment
     analysis: Analysis
@@ -136,61 +185,86 @@ class ReportRow(BaseModel):
     needs_review_reason: list[str] = Field(default_factory=list)
     recommendation_tags: list[str] = Field(default_factory=list)
     status: str = "ok"
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str = Field(default_factory=_batch_ts)
+
+    @classmethod
+    def build_trusted(
+        cls,
+        *,
+        ticker: TickerRow,
+        enrichment: Enrichment,
+        analysis: Analysis,
+        needs_review: bool = False,
+        needs_review_reason: list[str] | None = None,
+        recommendation_tags: list[str] | None = None,
+        status: str = "ok",
+    ) -> ReportRow:
+        """Assemble a row from sub-models the pipeline has already validated.
+
+        Skips pydantic validation (model_construct), so only pass instances that
+        were built through their own constructors.
+        """
+        return cls.model_construct(
+            ticker=ticker,
+            enrichment=enrichment,
+            analysis=analysis,
+            needs_review=needs_review,
+            needs_review_reason=list(needs_review_reason) if needs_review_reason else [],
+            recommendation_tags=list(recommendation_tags) if recommendation_tags else [],
+            status=status,
+            created_at=_batch_ts(),
+        )
 
     def all_errors(self) -> list[ErrorInfo]:
         return [*self.ticker.errors, *self.enrichment.errors, *self.analysis.errors]
 
+    def has_any_errors(self) -> bool:
+        """Truthiness of all_errors() without building the combined list."""
+        return bool(self.ticker.errors or self.enrichment.errors or self.analysis.errors)
+
     def to_archive_dict(self) -> dict[str, Any]:
-        return {
-            "ticker": self.ticker.model_dump(),
-            "enrichment": self.enrichment.model_dump(),
-            "analysis": self.analysis.model_dump(),
-            "needs_review": self.needs_review,
-            "needs_review_reason": self.needs_review_reason,
-            "recommendation_tags": self.recommendation_tags,
-            "status": self.status,
-            "created_at": self.created_at,
-        }
+        # The archive shape is exactly the field layout, so one top-level dump
+        # replaces three nested sub-model dumps.
+        return self.model_dump()
 
     def to_flat_dict(self) -> dict[str, Any]:
-        top_headline = self.enrichment.headlines[0] if self.enrichment.headlines else None
-        evidence_titles = "; ".join(
-            h.title for h in self.analysis.decision_trace.evidence_used if h.title
-        )
-        rules_triggered = "; ".join(self.analysis.decision_trace.rules_triggered)
-        numeric_signals = json.dumps(
-            self.analysis.decision_trace.numeric_signals_used,
-            ensure_ascii=True,
-        )
+        # Bind the sub-models once; this runs per row for both Excel and HTML.
+        ticker = self.ticker
+        enrichment = self.enrichment
+        analysis = self.analysis
+        trace = analysis.decision_trace
+        # Derived on every call: the critic, HITL rules and orchestrator edit the
+        # trace and tags in place, so a cached copy could go stale.
+        headlines = enrichment.headlines
+        top_headline = headlines[0] if headlines else None
         return {
-            "ticker": self.ticker.ticker,
-            "name": self.ticker.name,
-            "open_price": self.enrichment.open_price,
-            "close_price": self.enrichment.close_price,
-            "price": self.ticker.price,
-            "abs_change": self.ticker.abs_change,
-            "pct_change": self.ticker.pct_change,
-            "volume": self.ticker.volume,
-            "currency": self.ticker.currency,
-            "exchange": self.ticker.exchange,
-            "sector": self.enrichment.sector,
-            "industry": self.enrichment.industry,
-            "earnings_date": self.enrichment.earnings_date,
-            "action": self.analysis.action.value,
-            "confidence": self.analysis.confidence,
-            "sentiment": self.analysis.sentiment,
+            "ticker": ticker.ticker,
+            "name": ticker.name,
+            "open_price": enrichment.open_price,
+            "close_price": enrichment.close_price,
+            "price": ticker.price,
+            "abs_change": ticker.abs_change,
+            "pct_change": ticker.pct_change,
+            "volume": ticker.volume,
+            "currency": ticker.currency,
+            "exchange": ticker.exchange,
+            "sector": enrichment.sector,
+            "industry": enrichment.industry,
+            "earnings_date": enrichment.earnings_date,
+            "action": _ACTION_LABELS[analysis.action],
+            "confidence": analysis.confidence,
+            "sentiment": analysis.sentiment,
             "needs_review": self.needs_review,
             "needs_review_reason": "; ".join(self.needs_review_reason),
-            "why_it_moved": self.analysis.why_it_moved,
+            "why_it_moved": analysis.why_it_moved,
             "top_headline": top_headline.title if top_headline else None,
             "headline_url": top_headline.url if top_headline else None,
-            "trend_points": self.enrichment.price_series,
-            "decision_trace": self.analysis.decision_trace.explainability_summary,
-            "rules_triggered": rules_triggered,
-            "evidence_titles": evidence_titles,
-            "numeric_signals": numeric_signals,
-            "provenance_urls": ", ".join(self.analysis.provenance_urls),
+            "trend_points": enrichment.price_series,
+            "decision_trace": trace.explainability_summary,
+            "rules_triggered": "; ".join(trace.rules_triggered),
+            "evidence_titles": "; ".join(h.title for h in trace.evidence_used if h.title),
+            "numeric_signals": _SIGNALS_ENCODER.encode(trace.numeric_signals_used),
+            "provenance_urls": ", ".join(analysis.provenance_urls),
             "recommendation_tags": ", ".join(self.recommendation_tags),
             "errors": "; ".join(
                 f"{e.stage}:{e.error_type}:{e.error_message}" for e in self.all_errors()
@@ -199,12 +273,17 @@ class ReportRow(BaseModel):
 
 
 class RunArtifacts(BaseModel):
+    model_config = _DEFERRED
+
     status: str
     summary: dict[str, Any]
     paths: dict[str, str]
 
 
-class RunMeta(BaseModel):
+# Internal bookkeeping written to run.json; built from already-validated values,
+# so a plain dataclass avoids a pydantic schema build and validation pass.
+@dataclass(slots=True, kw_only=True)
+class RunMeta:
     run_id: str
     requested_date: str
     mode: str
@@ -217,35 +296,77 @@ class RunMeta(BaseModel):
     status: str
     summary: dict[str, Any]
     email: dict[str, Any]
-    timings_ms: dict[str, int] = Field(default_factory=dict)
+    timings_ms: dict[str, int] = field(default_factory=dict)
 
 
-def apply_hitl_rules(report: ReportRow) -> ReportRow:
-    reasons = list(report.needs_review_reason)
+# HITL thresholds: below this confidence, or beyond this absolute % move, a
+# human should look at the row.
+_HITL_MIN_CONFIDENCE = 0.75
+_HITL_EXTREME_PCT = 15.0
+
+# Reasons raised by apply_hitl_rules itself, in sorted order, so a bitmask of
+# triggered rules decodes straight to the sorted, de-duplicated list.
+_HITL_REASONS = (
+    "confidence_below_threshold",
+    "extreme_percent_change",
+    "has_explicit_errors",
+    "ingestion_fallback_used",
+    "missing_headlines",
+)
+_LOW_CONFIDENCE, _EXTREME_MOVE, _HAS_ERRORS, _FALLBACK_USED, _NO_HEADLINES = (
+    1 << i for i in range(len(_HITL_REASONS))
+)
 
+
+def apply_hitl_rules(report: ReportRow) -> ReportRow:
     confidence = report.analysis.confidence
     pct_change = report.ticker.pct_change
-    has_headlines = bool(report.enrichment.headlines)
-    fallback_used = report.ticker.ingestion_fallback_used
-
-    if confidence < 0.75:
-        reasons.append("confidence_below_threshold")
-    if pct_change is not None and abs(pct_change) > 15:
-        reasons.append("extreme_percent_change")
-    if not has_headlines:
-        reasons.append("missing_headlines")
-    if fallback_used:
-        reasons.append("ingestion_fallback_used")
-    if report.all_errors():
-        reasons.append("has_explicit_errors")
-
-    unique = sorted(set(reasons))
+    has_errors = report.has_any_errors()
+
+    mask = 0
+    if confidence < _HITL_MIN_CONFIDENCE:
+        mask |= _LOW_CONFIDENCE
+    if pct_change is not None and abs(pct_change) > _HITL_EXTREME_PCT:
+        mask |= _EXTREME_MOVE
+    if not report.enrichment.headlines:
+        mask |= _NO_HEADLINES
+    if report.ticker.ingestion_fallback_used:
+        mask |= _FALLBACK_USED
+    if has_errors:
+        mask |= _HAS_ERRORS
+
+    triggered = [reason for i, reason in enumerate(_HITL_REASONS) if mask >> i & 1]
+    # Critic flags and fallback markers are free-form, so only merge + sort
+    # when the row already carries some.
+    prior = report.needs_review_reason
+    unique = sorted(set(prior).union(triggered)) if prior else triggered
     report.needs_review_reason = unique
     report.needs_review = bool(unique)
-    if report.status == "ok" and report.all_errors():
+    if report.status == "ok" and has_errors:
         report.status = "partial"
     return report
 
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") for the last call. Swapped
+# as one tuple so concurrent callers never pair a second with another prefix.
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def quote_url(ticker: str) -> str:
+    """Yahoo quote page for ``ticker``; used for provenance and report links."""
+    return f"https://finance.yahoo.com/quote/{ticker}"
+
+
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Current UTC time as ISO-8601 with microseconds and a +00:00 offset.
+
+    Calls within the same second reuse the formatted date/time prefix; only the
+    microsecond suffix is rendered per call.
+    """
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_second_cache
+    if cached_seconds != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
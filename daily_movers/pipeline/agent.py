@@ -18,10 +18,14 @@ to deterministic heuristic logic – so the pipeline never crashes.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import math
 import re
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Any, Literal, TypedDict
 
 from daily_movers.config import AppConfig
@@ -32,24 +36,37 @@ from daily_movers.models import (
     Enrichment,
     Headline,
     TickerRow,
+    quote_url,
 )
+from daily_movers.pipeline.critic_core import ensure_sentence_end, split_sentences
+from daily_movers.pipeline.llm_cache import analyst_cache
 from daily_movers.storage.runs import StructuredLogger
 
+_COMPACT_JSON = (",", ":")
+_COT_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            ("chain of thought", "chain-of-thought", "step-by-step", "let me think", "internal reasoning"),
+        )
+    )
+)
+
 # ---------------------------------------------------------------------------
 # Typed state that flows through the graph
 # ---------------------------------------------------------------------------
 
 class AgentState(TypedDict, total=False):
     """Mutable state passed between LangGraph nodes."""
-    row: dict[str, Any]
-    enrichment: dict[str, Any]
-    _config: dict[str, Any]
-    _logger_path: str
-    _run_id: str
-    _log_level: str
+    row: TickerRow | dict[str, Any]
+    enrichment: Enrichment | dict[str, Any]
+    _config: AppConfig | dict[str, Any]
+    _run_logger: StructuredLogger
     evidence_summary: str
     evidence_headlines: list[dict[str, Any]]
     numeric_signals: dict[str, Any]
+    numeric_signals_json: str
+    evidence_headlines_json: str
     analyst_output: dict[str, Any]
     critic_flags: list[str]
     critic_approved: bool
@@ -76,13 +93,14 @@ def _build_graph():
     graph.add_node("analyst", analyst_node)
     graph.add_node("critic", critic_node)
     graph.add_node("recommender", recommender_node)
+    graph.add_node("finalize", finalize_node)
 
     graph.add_edge(START, "researcher")
     graph.add_edge("researcher", "analyst")
     graph.add_conditional_edges(
         "analyst",
         _analyst_to_critic_or_end,
-        {"critic": "critic", "end": END},
+        {"critic": "critic", "finalize": "finalize", "end": END},
     )
     graph.add_conditional_edges(
         "critic",
@@ -90,21 +108,51 @@ def _build_graph():
         {"recommender": "recommender", "retry_analyst": "analyst", "end": END},
     )
     graph.add_edge("recommender", END)
+    graph.add_edge("finalize", END)
 
     return graph.compile()
 
 
 # Singleton compiled graph (created once per process)
 _compiled_graph = None
+_compiled_graph_lock = threading.Lock()
 
 
 def _get_graph():
     global _compiled_graph
     if _compiled_graph is None:
-        _compiled_graph = _build_graph()
+        with _compiled_graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = _build_graph()
     return _compiled_graph
 
 
+def init_worker() -> None:
+    """Compile the graph up front (e.g. as a pool ``initializer``) so the
+    first ticker does not pay the LangGraph import and compile cost."""
+    _get_graph()
+
+
+def _run_linear(state: AgentState) -> AgentState:
+    """Walk the graph's nodes in-process, without LangGraph's Pregel loop.
+
+    Uses the same routing functions as ``_build_graph`` so the result matches
+    ``graph.invoke``; worthwhile when every node is plain heuristic Python.
+    """
+    state.update(researcher_node(state))  # type: ignore[typeddict-item]
+    while True:
+        state.update(analyst_node(state))  # type: ignore[typeddict-item]
+        if _analyst_to_critic_or_end(state) == "end":
+            return state
+        state.update(critic_node(state))  # type: ignore[typeddict-item]
+        route = _critic_routing(state)
+        if route == "recommender":
+            state.update(recommender_node(state))  # type: ignore[typeddict-item]
+            return state
+        if route == "end":
+            return state
+
+
 # ---------------------------------------------------------------------------
 # Public entry-point
 # ---------------------------------------------------------------------------
@@ -118,63 +166,243 @@ def run_agent_analysis(
 ) -> Analysis:
     """Execute the full LangGraph agent pipeline for a single ticker.
 
-    Returns a validated Analysis model.  Never raises – falls back to
-    heuristics on any internal error.
+    Without an OpenAI key the nodes run through ``_run_linear`` instead of the
+    compiled graph.  Returns a validated Analysis model.  Never raises – falls
+    back to heuristics on any internal error.
     """
-    initial_state: AgentState = {
-        "row": row.model_dump(),
-        "enrichment": enrichment.model_dump(),
-        "evidence_summary": "",
-        "evidence_headlines": [],
-        "numeric_signals": {},
-        "analyst_output": {},
-        "critic_flags": [],
-        "critic_approved": False,
-        "retry_count": 0,
-        "analysis": {},
-        "recommendation_tags": [],
-        "model_used": "langgraph:heuristics",
-        "error": None,
-    }
+    initial_state = _initial_state(row=row, enrichment=enrichment, config=config, run_logger=run_logger)
 
-    # Inject config so nodes can access LLM settings
-    initial_state["_config"] = config.model_dump()  # type: ignore[typeddict-unknown-key]
-    initial_state["_logger_path"] = str(run_logger.path)  # type: ignore[typeddict-unknown-key]
-    initial_state["_run_id"] = run_logger.run_id  # type: ignore[typeddict-unknown-key]
-    initial_state["_log_level"] = config.log_level  # type: ignore[typeddict-unknown-key]
+    try:
+        if config.openai_api_key:
+            final_state = _get_graph().invoke(initial_state)
+        else:
+            final_state = _run_linear(initial_state)
+        return _analysis_from_final_state(final_state, row=row, run_logger=run_logger)
+    except Exception as exc:
+        return _fallback_analysis(exc, row=row, enrichment=enrichment, run_logger=run_logger)
+
+
+async def run_agent_analysis_async(
+    *,
+    row: TickerRow,
+    enrichment: Enrichment,
+    config: AppConfig,
+    run_logger: StructuredLogger,
+    semaphore: asyncio.Semaphore | None = None,
+) -> Analysis:
+    """Async variant of ``run_agent_analysis`` built on the graph's ``ainvoke``.
+
+    Lets async callers ``asyncio.gather`` many tickers; pass a shared
+    ``semaphore`` to cap how many graphs (and so LLM requests) are in flight.
+    Same contract: never raises, falls back to heuristics.
+    """
+    initial_state = _initial_state(row=row, enrichment=enrichment, config=config, run_logger=run_logger)
 
     try:
+        if not config.openai_api_key:
+            # Heuristic nodes never await anything; skip the event-loop hops.
+            final_state = _run_linear(initial_state)
+            return _analysis_from_final_state(final_state, row=row, run_logger=run_logger)
         graph = _get_graph()
-        final_state = graph.invoke(initial_state)
-        analysis_dict = final_state.get("analysis") or {}
-        if not analysis_dict:
-            raise ValueError("agent graph produced empty analysis")
-
-        analysis = Analysis.model_validate(analysis_dict)
-        analysis.model_used = final_state.get("model_used", "langgraph:heuristics")
-
-        run_logger.info(
-            "agent_analysis_completed",
-            stage="agent",
-            symbol=row.ticker,
-            model_used=analysis.model_used,
-        )
-        return analysis
-
+        if semaphore is None:
+            final_state = await graph.ainvoke(initial_state)
+        else:
+            async with semaphore:
+                final_state = await graph.ainvoke(initial_state)
+        return _analysis_from_final_state(final_state, row=row, run_logger=run_logger)
     except Exception as exc:
-        run_logger.warning(
-            "agent_analysis_fallback",
-            stage="agent",
-            symbol=row.ticker,
-            error_type=exc.__class__.__name__,
-            error_message=str(exc),
-            fallback_used=True,
-        )
-        # Fall back to deterministic heuristics
-        from daily_movers.pipeline.heuristics import analyze_with_heuristics
-        analysis = analyze_with_heuristics(row=row, enrichment=enrichment)
-        analysis.model_used = "langgraph:heuristic_fallback"
-        return analysis
+        return _fallback_analysis(exc, row=row, enrichment=enrichment, run_logger=run_logger)
+
+
+def _analysis_from_final_state(
+    final_state: dict[str, Any],
+    *,
+    row: TickerRow,
+    run_logger: StructuredLogger,
+) -> Analysis:
+    analysis_dict = final_state.get("analysis") or {}
+    if not analysis_dict:
+        raise ValueError("agent graph produced empty analysis")
+
+    analysis = _trusted_analysis(analysis_dict, model_used=final_state.get("model_used", "langgraph:heuristics"))
+
+    run_logger.async_info(
+        "agent_analysis_completed",
+        stage="agent",
+        symbol=row.ticker,
+        model_used=analysis.model_used,
+    )
+    return analysis
+
+
+def _trusted_analysis(analysis_dict: dict[str, Any], *, model_used: str) -> Analysis:
+    """Build an Analysis from critic_node output without re-validating it.
+
+    critic_node is the only producer of ``analysis`` in the state and has
+    already clamped sentiment/confidence, normalised the action to
+    BUY/WATCH/SELL and coerced every text field, so ``model_construct`` is
+    safe here. Nested models are constructed explicitly because
+    ``model_construct`` does not recurse.
+    """
+    trace = analysis_dict["decision_trace"]
+    return Analysis.model_construct(
+        why_it_moved=analysis_dict["why_it_moved"],
+        sentiment=analysis_dict["sentiment"],
+        action=Action(analysis_dict["action"]),
+        confidence=analysis_dict["confidence"],
+        decision_trace=DecisionTrace.model_construct(
+            evidence_used=[Headline(**h) for h in trace["evidence_used"]],
+            numeric_signals_used=trace["numeric_signals_used"],
+            rules_triggered=trace["rules_triggered"],
+            explainability_summary=trace["explainability_summary"],
+        ),
+        provenance_urls=analysis_dict["provenance_urls"],
+        model_used=model_used,
+        errors=[],
+    )
+
+
+def _fallback_analysis(
+    exc: Exception,
+    *,
+    row: TickerRow,
+    enrichment: Enrichment,
+    run_logger: StructuredLogger,
+) -> Analysis:
+    run_logger.async_warning(
+        "agent_analysis_fallback",
+        stage="agent",
+        symbol=row.ticker,
+        error_type=exc.__class__.__name__,
+        error_message=str(exc),
+        fallback_used=True,
+    )
+    # Fall back to deterministic heuristics
+    from daily_movers.pipeline.heuristics import analyze_with_heuristics
+    analysis = analyze_with_heuristics(row=row, enrichment=enrichment)
+    analysis.model_used = "langgraph:heuristic_fallback"
+    return analysis
+
+
+def run_agent_analysis_batch(
+    *,
+    rows: list[TickerRow],
+    enrichments: list[Enrichment],
+    config: AppConfig,
+    run_logger: StructuredLogger,
+    batch_size: int = 10,
+) -> list[Analysis]:
+    """Analyse many tickers, packing up to ``batch_size`` into each LLM request.
+
+    Researcher and critic logic is shared with the single-ticker graph; only
+    the analyst call is batched. Tickers the batch response omits, or that
+    the critic sends back for a retry, go through ``run_agent_analysis``, so
+    every row still gets an Analysis. Without an OpenAI key this is simply
+    the per-ticker heuristic graph. Results are returned in input order.
+    """
+    if len(rows) != len(enrichments):
+        raise ValueError("rows and enrichments must have the same length")
+    if not config.openai_api_key:
+        return [
+            run_agent_analysis(row=row, enrichment=enrichment, config=config, run_logger=run_logger)
+            for row, enrichment in zip(rows, enrichments)
+        ]
+
+    states: list[AgentState] = []
+    for row, enrichment in zip(rows, enrichments):
+        state = _initial_state(row=row, enrichment=enrichment, config=config, run_logger=run_logger)
+        state.update(researcher_node(state))  # type: ignore[typeddict-item]
+        states.append(state)
+    payloads = [
+        {
+            "ticker": row.ticker,
+            "evidence_summary": state["evidence_summary"],
+            "numeric_signals": state["numeric_signals"],
+            "headlines": state["evidence_headlines"],
+        }
+        for row, state in zip(rows, states)
+    ]
+
+    model_used = f"langgraph:openai:{config.analysis_model}"
+    results: list[Analysis | None] = [None] * len(rows)
+    for chunk in _batch_chunks(payloads, batch_size=batch_size):
+        try:
+            outputs = _llm_analyst_batch(
+                api_key=config.openai_api_key,
+                model=config.analysis_model,
+                base_url=config.openai_base_url,
+                timeout=config.openai_timeout_seconds,
+                items=[payloads[idx] for idx in chunk],
+            )
+        except Exception as exc:
+            run_logger.async_warning(
+                "agent_llm_batch_failed",
+                stage="agent",
+                error_type=exc.__class__.__name__,
+                error_message=str(exc),
+                fallback_used=True,
+                batch_size=len(chunk),
+            )
+            continue
+
+        for idx in chunk:
+            output = outputs.get(rows[idx].ticker)
+            if output is None:
+                continue
+            verdict = critic_node({**states[idx], "analyst_output": output, "model_used": model_used})
+            if not verdict.get("critic_approved"):
+                continue
+            results[idx] = _trusted_analysis(verdict["analysis"], model_used=model_used)
+            run_logger.async_info(
+                "agent_analysis_completed",
+                stage="agent",
+                symbol=rows[idx].ticker,
+                model_used=model_used,
+                batched=True,
+            )
+
+    return [
+        analysis
+        if analysis is not None
+        else run_agent_analysis(row=rows[idx], enrichment=enrichments[idx], config=config, run_logger=run_logger)
+        for idx, analysis in enumerate(results)
+    ]
+
+
+# Defaults for every run; copied per ticker. Nodes return fresh values rather
+# than mutating state in place, so the shared empty containers stay empty.
+_INITIAL_STATE_TEMPLATE: MappingProxyType[str, Any] = MappingProxyType({
+    "evidence_summary": "",
+    "evidence_headlines": [],
+    "numeric_signals": {},
+    "analyst_output": {},
+    "critic_flags": [],
+    "critic_approved": False,
+    "retry_count": 0,
+    "analysis": {},
+    "recommendation_tags": [],
+    "model_used": "langgraph:heuristics",
+    "error": None,
+})
+
+
+def _initial_state(
+    *,
+    row: TickerRow,
+    enrichment: Enrichment,
+    config: AppConfig,
+    run_logger: StructuredLogger,
+) -> AgentState:
+    state: AgentState = dict(_INITIAL_STATE_TEMPLATE)  # type: ignore[assignment]
+    state["row"] = row
+    state["enrichment"] = enrichment
+
+    # Inject config so nodes can access LLM settings
+    state["_config"] = config  # type: ignore[typeddict-unknown-key]
+    # Nodes log through the run's own logger so their records share its
+    # buffer (and ordering) instead of reopening run.log.
+    state["_run_logger"] = run_logger
+    return state
 
 
 # ---------------------------------------------------------------------------
@@ -186,19 +414,21 @@ def researcher_node(state: AgentState) -> dict[str, Any]:
     enrichment = state.get("enrichment", {})
     row = state.get("row", {})
 
-    headlines_raw = enrichment.get("headlines", [])
+    headlines_raw = _g(enrichment, "headlines") or []
     evidence: list[dict[str, Any]] = []
     for h in headlines_raw[:5]:
         evidence.append({
-            "title": h.get("title", ""),
-            "url": h.get("url", ""),
-            "published_at": h.get("published_at"),
+            "title": _g(h, "title", ""),
+            "url": _g(h, "url", ""),
+            "published_at": _g(h, "published_at"),
         })
 
-    pct = float(row.get("pct_change") or 0.0)
-    abs_change = float(row.get("abs_change") or 0.0)
-    price = float(row.get("price") or 0.0)
-    volume = float(row.get("volume") or 0.0)
+    pct = float(_g(row, "pct_change") or 0.0)
+    abs_change = float(_g(row, "abs_change") or 0.0)
+    price = float(_g(row, "price") or 0.0)
+    volume = float(_g(row, "volume") or 0.0)
+    sector = _g(enrichment, "sector")
+    earnings_date = _g(enrichment, "earnings_date")
 
     numeric_signals = {
         "price": price,
@@ -206,37 +436,35 @@ def researcher_node(state: AgentState) -> dict[str, Any]:
         "pct_change": pct,
         "volume": volume,
         "headline_count": len(evidence),
-        "open_price": enrichment.get("open_price"),
-        "close_price": enrichment.get("close_price"),
-        "sector": enrichment.get("sector"),
-        "industry": enrichment.get("industry"),
-        "earnings_date": enrichment.get("earnings_date"),
-        "price_trend_points": len(enrichment.get("price_series", [])),
+        "open_price": _g(enrichment, "open_price"),
+        "close_price": _g(enrichment, "close_price"),
+        "sector": sector,
+        "industry": _g(enrichment, "industry"),
+        "earnings_date": earnings_date,
+        "price_trend_points": len(_g(enrichment, "price_series") or ()),
     }
 
     # Build a human-readable evidence summary for the analyst
-    ticker = row.get("ticker", "???")
+    ticker = _g(row, "ticker", "???")
+    parts = [f"{ticker} moved {pct:+.2f}% (${abs_change:+.2f}) on volume {volume:,.0f}."]
     if evidence:
         top_titles = "; ".join(h["title"][:80] for h in evidence[:3])
-        summary = (
-            f"{ticker} moved {pct:+.2f}% (${abs_change:+.2f}) on volume {volume:,.0f}. "
-            f"Key headlines: {top_titles}."
-        )
+        parts.append(f"Key headlines: {top_titles}.")
     else:
-        summary = (
-            f"{ticker} moved {pct:+.2f}% (${abs_change:+.2f}) on volume {volume:,.0f}. "
-            f"No fresh headline evidence available."
-        )
-
-    if enrichment.get("sector"):
-        summary += f" Sector: {enrichment['sector']}."
-    if enrichment.get("earnings_date"):
-        summary += f" Next earnings: {enrichment['earnings_date']}."
+        parts.append("No fresh headline evidence available.")
+    if sector:
+        parts.append(f"Sector: {sector}.")
+    if earnings_date:
+        parts.append(f"Next earnings: {earnings_date}.")
+    summary = " ".join(parts)
 
     return {
         "evidence_summary": summary,
         "evidence_headlines": evidence,
         "numeric_signals": numeric_signals,
+        # Serialised once for the analyst prompt (and reused on a retry).
+        "numeric_signals_json": json.dumps(numeric_signals, separators=_COMPACT_JSON),
+        "evidence_headlines_json": json.dumps(evidence, separators=_COMPACT_JSON),
     }
 
 
@@ -250,10 +478,9 @@ def analyst_node(state: AgentState) -> dict[str, Any]:
     If an OpenAI key is available and LangChain ChatOpenAI works, uses the LLM.
     Otherwise falls back to rule-based heuristics.
     """
-    config_dict = state.get("_config", {})
-    api_key = config_dict.get("openai_api_key")
+    config = state.get("_config", {})
+    api_key = _g(config, "openai_api_key")
     row = state.get("row", {})
-    enrichment_dict = state.get("enrichment", {})
     evidence_summary = state.get("evidence_summary", "")
     evidence_headlines = state.get("evidence_headlines", [])
     numeric_signals = state.get("numeric_signals", {})
@@ -262,15 +489,17 @@ def analyst_node(state: AgentState) -> dict[str, Any]:
         try:
             result = _llm_analyst(
                 api_key=api_key,
-                model=config_dict.get("analysis_model", "gpt-4o-mini"),
-                base_url=config_dict.get("openai_base_url", "https://api.openai.com/v1"),
-                timeout=config_dict.get("openai_timeout_seconds", 45),
-                ticker=row.get("ticker", "???"),
+                model=_g(config, "analysis_model", "gpt-4o-mini"),
+                base_url=_g(config, "openai_base_url", "https://api.openai.com/v1"),
+                timeout=_g(config, "openai_timeout_seconds", 45),
+                ticker=_g(row, "ticker", "???"),
                 evidence_summary=evidence_summary,
                 evidence_headlines=evidence_headlines,
                 numeric_signals=numeric_signals,
+                numeric_signals_json=state.get("numeric_signals_json"),
+                evidence_headlines_json=state.get("evidence_headlines_json"),
             )
-            result["model_used"] = f"langgraph:openai:{config_dict.get('analysis_model', 'gpt-4o-mini')}"
+            result["model_used"] = f"langgraph:openai:{_g(config, 'analysis_model', 'gpt-4o-mini')}"
             return {"analyst_output": result, "model_used": result["model_used"]}
         except Exception as exc:
             _log_agent_event(
@@ -293,6 +522,71 @@ def analyst_node(state: AgentState) -> dict[str, Any]:
     return {"analyst_output": result, "model_used": "langgraph:heuristics"}
 
 
+_ANALYST_SYSTEM_PROMPT = (
+    "You are a financial analyst AI. You produce concise, evidence-based stock analysis. "
+    "Return ONLY valid JSON with these exact keys: "
+    "why_it_moved (exactly 2 sentences), sentiment (float -1 to 1), "
+    "action (BUY/WATCH/SELL), confidence (float 0 to 1), "
+    "rules_triggered (list of rule name strings), "
+    "explainability_summary (1 sentence). "
+    "Never include chain-of-thought. Reference only provided evidence."
+)
+
+# A single-ticker analysis is ~150-250 tokens of JSON; the cap stops a
+# rambling completion from dominating latency.
+_ANALYST_MAX_TOKENS = 400
+
+# Batched analyst requests: keep each prompt under a rough token budget
+# (~4 chars/token) and cap completion tokens per ticker in the batch.
+_BATCH_PROMPT_TOKEN_BUDGET = 3000
+_BATCH_MAX_TOKENS_PER_TICKER = 300
+
+
+# Shared ChatOpenAI clients, keyed on a SHA-256 of the API key (never the key
+# itself, as with the AppConfig cache) plus the connection settings.
+_CHAT_MODEL_CACHE_SIZE = 8
+_chat_models: OrderedDict[tuple[str, str, str, int], Any] = OrderedDict()
+_chat_models_lock = threading.Lock()
+
+
+def _chat_model(*, api_key: str, model: str, base_url: str, timeout: int):
+    """Shared ChatOpenAI per settings, so its HTTP client and pooled TLS
+    connections are reused across tickers instead of rebuilt per call.
+
+    Completion caps differ per call (single ticker vs. batch size), so callers
+    apply them with ``.bind(max_tokens=...)`` rather than keying the cache on them.
+    """
+    cache_key = (hashlib.sha256(api_key.encode("utf-8")).hexdigest(), model, base_url, timeout)
+    with _chat_models_lock:
+        client = _chat_models.get(cache_key)
+        if client is not None:
+            _chat_models.move_to_end(cache_key)
+            return client
+    client = _build_chat_model(api_key=api_key, model=model, base_url=base_url, timeout=timeout)
+    with _chat_models_lock:
+        client = _chat_models.setdefault(cache_key, client)
+        _chat_models.move_to_end(cache_key)
+        while len(_chat_models) > _CHAT_MODEL_CACHE_SIZE:
+            _chat_models.popitem(last=False)
+    return client
+
+
+def _build_chat_model(*, api_key: str, model: str, base_url: str, timeout: int):
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        base_url=base_url,
+        temperature=0.1,
+        timeout=timeout,
+        max_retries=1,
+        # JSON mode: the API guarantees a parseable object (the prompts above
+        # mention JSON, which OpenAI requires for this mode).
+        model_kwargs={"response_format": {"type": "json_object"}},
+    )
+
+
 def _llm_analyst(
     *,
     api_key: str,
@@ -303,43 +597,130 @@ def _llm_analyst(
     evidence_summary: str,
     evidence_headlines: list[dict[str, Any]],
     numeric_signals: dict[str, Any],
+    numeric_signals_json: str | None = None,
+    evidence_headlines_json: str | None = None,
 ) -> dict[str, Any]:
-    """Call ChatOpenAI via LangChain to produce structured analysis."""
-    from langchain_openai import ChatOpenAI
+    """Call ChatOpenAI via LangChain to produce structured analysis.
+
+    Identical prompts (same model, endpoint and evidence) within the cache TTL
+    reuse the previous normalised result instead of calling the API again.
+    """
     from langchain_core.messages import SystemMessage, HumanMessage
 
-    llm = ChatOpenAI(
+    if numeric_signals_json is None:
+        numeric_signals_json = json.dumps(numeric_signals, separators=_COMPACT_JSON)
+    if evidence_headlines_json is None:
+        evidence_headlines_json = json.dumps(evidence_headlines, separators=_COMPACT_JSON)
+    human_text = (
+        f"Analyze {ticker}.\n\n"
+        f"Evidence summary: {evidence_summary}\n\n"
+        f"Numeric signals: {numeric_signals_json}\n\n"
+        f"Headlines: {evidence_headlines_json}\n\n"
+        "Produce your JSON analysis now."
+    )
+    cache_key = analyst_cache.key(model, base_url, _ANALYST_SYSTEM_PROMPT, human_text)
+    cached = analyst_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    llm = _chat_model(
+        api_key=api_key,
         model=model,
-        api_key=lambda: api_key,
         base_url=base_url,
-        temperature=0.1,
         timeout=timeout,
-        max_retries=1,
+    ).bind(max_tokens=_ANALYST_MAX_TOKENS)
+
+    system_msg = SystemMessage(content=_ANALYST_SYSTEM_PROMPT)
+    human_msg = HumanMessage(content=human_text)
+
+    response = llm.invoke([system_msg, human_msg])
+    text = response.content if isinstance(response.content, str) else str(response.content)
+    parsed = _extract_json(text)
+    result = _normalise_llm_output(
+        parsed,
+        ticker=ticker,
+        numeric_signals=numeric_signals,
+        evidence_headlines=evidence_headlines,
     )
+    analyst_cache.put(cache_key, result)
+    return result
+
+
+def _llm_analyst_batch(
+    *,
+    api_key: str,
+    model: str,
+    base_url: str,
+    timeout: int,
+    items: list[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """One ChatOpenAI call for several tickers; returns ticker -> analyst output.
+
+    Each item carries ticker, evidence_summary, numeric_signals and headlines.
+    Entries the model omits or mangles are simply absent from the result.
+    """
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    llm = _chat_model(
+        api_key=api_key,
+        model=model,
+        base_url=base_url,
+        timeout=timeout,
+    ).bind(max_tokens=_BATCH_MAX_TOKENS_PER_TICKER * len(items))
 
     system_msg = SystemMessage(content=(
-        "You are a financial analyst AI. You produce concise, evidence-based stock analysis. "
-        "Return ONLY valid JSON with these exact keys: "
-        "why_it_moved (exactly 2 sentences), sentiment (float -1 to 1), "
-        "action (BUY/WATCH/SELL), confidence (float 0 to 1), "
-        "rules_triggered (list of rule name strings), "
-        "explainability_summary (1 sentence). "
-        "Never include chain-of-thought. Reference only provided evidence."
+        _ANALYST_SYSTEM_PROMPT
+        + " You will receive several tickers. Return ONE JSON object mapping each "
+        "ticker symbol to an object with those keys."
     ))
-
     human_msg = HumanMessage(content=(
-        f"Analyze {ticker}.\n\n"
-        f"Evidence summary: {evidence_summary}\n\n"
-        f"Numeric signals: {json.dumps(numeric_signals)}\n\n"
-        f"Headlines: {json.dumps(evidence_headlines)}\n\n"
-        "Produce your JSON analysis now."
+        f"Analyze these tickers:\n\n{json.dumps(items, separators=_COMPACT_JSON)}\n\n"
+        "Produce your JSON object now."
     ))
 
     response = llm.invoke([system_msg, human_msg])
     text = response.content if isinstance(response.content, str) else str(response.content)
     parsed = _extract_json(text)
 
-    # Normalise and validate
+    by_ticker = {item["ticker"]: item for item in items}
+    outputs: dict[str, dict[str, Any]] = {}
+    for key, entry in parsed.items():
+        item = by_ticker.get(str(key).strip().upper())
+        if item is None or not isinstance(entry, dict):
+            continue
+        outputs[item["ticker"]] = _normalise_llm_output(
+            entry,
+            ticker=item["ticker"],
+            numeric_signals=item["numeric_signals"],
+            evidence_headlines=item["headlines"],
+        )
+    return outputs
+
+
+def _batch_chunks(items: list[dict[str, Any]], *, batch_size: int) -> list[list[int]]:
+    """Group item indexes into batches bounded by count and estimated prompt tokens."""
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for idx, item in enumerate(items):
+        tokens = len(json.dumps(item)) // 4
+        if current and (len(current) >= batch_size or current_tokens + tokens > _BATCH_PROMPT_TOKEN_BUDGET):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _normalise_llm_output(
+    parsed: dict[str, Any],
+    *,
+    ticker: str,
+    numeric_signals: dict[str, Any],
+    evidence_headlines: list[dict[str, Any]],
+) -> dict[str, Any]:
     sentiment = _clamp(_to_float(parsed.get("sentiment"), 0.0), -1.0, 1.0)
     confidence = _clamp(_to_float(parsed.get("confidence"), 0.6), 0.0, 1.0)
     action = _normalise_action(parsed.get("action"), sentiment)
@@ -372,16 +753,16 @@ def _llm_analyst(
 
 def _heuristic_analyst(
     *,
-    row: dict[str, Any],
+    row: TickerRow | dict[str, Any],
     evidence_summary: str,
     evidence_headlines: list[dict[str, Any]],
     numeric_signals: dict[str, Any],
 ) -> dict[str, Any]:
     """Pure heuristic analysis matching the logic in heuristics.py."""
-    pct = float(row.get("pct_change") or 0.0)
-    volume = float(row.get("volume") or 0.0)
+    pct = float(_g(row, "pct_change") or 0.0)
+    volume = float(_g(row, "volume") or 0.0)
     has_headlines = bool(evidence_headlines)
-    ticker = row.get("ticker", "???")
+    ticker = _g(row, "ticker", "???")
 
     sentiment = _clamp(pct / 12.0, -1.0, 1.0)
 
@@ -441,11 +822,22 @@ def _heuristic_analyst(
 # Conditional edge: analyst → critic or end
 # ---------------------------------------------------------------------------
 
-def _analyst_to_critic_or_end(state: AgentState) -> Literal["critic", "end"]:
-    """If analyst produced output, proceed to critic.  Otherwise end."""
-    if state.get("analyst_output"):
-        return "critic"
-    return "end"
+# Analyst confidence below this makes the critic request one retry.
+_CRITIC_RETRY_BELOW = 0.35
+
+
+def _analyst_to_critic_or_end(state: AgentState) -> Literal["critic", "finalize", "end"]:
+    """If analyst produced output, proceed to critic.  Otherwise end.
+
+    The critic only asks for a retry below 0.35 confidence, so confident
+    output goes to ``finalize`` (critic + recommender in one graph step).
+    """
+    analyst = state.get("analyst_output")
+    if not analyst:
+        return "end"
+    if _clamp(_to_float(analyst.get("confidence"), 0.6), 0.0, 1.0) >= _CRITIC_RETRY_BELOW:
+        return "finalize"
+    return "critic"
 
 
 # ---------------------------------------------------------------------------
@@ -457,20 +849,17 @@ def critic_node(state: AgentState) -> dict[str, Any]:
     Analysis dict.  May request one retry by setting critic_approved=False."""
     analyst = state.get("analyst_output", {})
     row = state.get("row", {})
-    enrichment_dict = state.get("enrichment", {})
     evidence_headlines = state.get("evidence_headlines", [])
     numeric_signals = state.get("numeric_signals", {})
     retry_count = state.get("retry_count", 0)
 
     flags: list[str] = []
-    ticker = row.get("ticker", "???")
+    ticker = _g(row, "ticker", "???")
 
     # -- Guard-rails --
     why = analyst.get("why_it_moved", "")
-    lower_why = why.lower()
-    cot_patterns = ["chain of thought", "chain-of-thought", "step-by-step", "let me think", "internal reasoning"]
-    if any(p in lower_why for p in cot_patterns):
-        pct = float(row.get("pct_change") or 0)
+    if _COT_RE.search(why.lower()):
+        pct = float(_g(row, "pct_change") or 0)
         why = (
             f"{ticker} moved {pct:+.2f}% based on observed market signals and cited evidence only. "
             "The explanation was sanitised to remove internal reasoning language."
@@ -488,7 +877,7 @@ def critic_node(state: AgentState) -> dict[str, Any]:
         flags.append("confidence_reduced_no_headlines")
 
     # Low confidence → maybe retry once
-    if confidence < 0.35 and retry_count < 1:
+    if confidence < _CRITIC_RETRY_BELOW and retry_count < 1:
         flags.append("low_confidence_retry_requested")
         return {
             "critic_flags": flags,
@@ -497,14 +886,10 @@ def critic_node(state: AgentState) -> dict[str, Any]:
         }
 
     # Build provenance URLs
-    provenance: list[str] = []
-    for h in evidence_headlines:
-        url = h.get("url")
-        if url and url not in provenance:
-            provenance.append(url)
-    quote_url = f"https://finance.yahoo.com/quote/{ticker}"
-    if quote_url not in provenance:
-        provenance.append(quote_url)
+    provenance = list(dict.fromkeys(url for h in evidence_headlines if (url := h.get("url"))))
+    ticker_quote_url = quote_url(ticker)
+    if ticker_quote_url not in provenance:
+        provenance.append(ticker_quote_url)
 
     rules = analyst.get("rules_triggered", [])
     if not isinstance(rules, list):
@@ -520,7 +905,7 @@ def critic_node(state: AgentState) -> dict[str, Any]:
         flags.append("explainability_backfilled")
 
     # Ensure why_it_moved is exactly two sentences
-    pct_val = float(row.get("pct_change") or 0)
+    pct_val = float(_g(row, "pct_change") or 0)
     why = _ensure_two_sentences(why, ticker=ticker, pct=pct_val, action=action,
                                 confidence=confidence, has_headlines=has_headlines)
 
@@ -530,10 +915,8 @@ def critic_node(state: AgentState) -> dict[str, Any]:
         "action": action,
         "confidence": confidence,
         "decision_trace": {
-            "evidence_used": [
-                {"title": h.get("title", ""), "url": h.get("url", ""), "published_at": h.get("published_at")}
-                for h in evidence_headlines[:3]
-            ],
+            # researcher_node already shaped these as title/url/published_at
+            "evidence_used": evidence_headlines[:3],
             "numeric_signals_used": numeric_signals,
             "rules_triggered": rules,
             "explainability_summary": expl.strip(),
@@ -549,6 +932,14 @@ def critic_node(state: AgentState) -> dict[str, Any]:
     }
 
 
+def finalize_node(state: AgentState) -> dict[str, Any]:
+    """Critic and recommender as one step, for output the critic will approve."""
+    update = critic_node(state)
+    if update.get("critic_approved"):
+        update.update(recommender_node({**state, **update}))  # type: ignore[typeddict-item]
+    return update
+
+
 # ---------------------------------------------------------------------------
 # Conditional edge: critic → recommender, retry, or end
 # ---------------------------------------------------------------------------
@@ -603,6 +994,13 @@ def recommender_node(state: AgentState) -> dict[str, Any]:
 # Helper utilities
 # ---------------------------------------------------------------------------
 
+def _g(obj: Any, key: str, default: Any = None) -> Any:
+    """Field access that works for both models and their dumped dicts."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
 def _extract_json(text: str) -> dict[str, Any]:
     stripped = text.strip()
     # Try parsing directly
@@ -612,31 +1010,37 @@ def _extract_json(text: str) -> dict[str, Any]:
             return parsed
     except json.JSONDecodeError:
         pass
-    # Try extracting first JSON object
-    match = re.search(r"\{.*\}", stripped, flags=re.DOTALL)
-    if match:
-        try:
-            parsed = json.loads(match.group(0))
-            if isinstance(parsed, dict):
-                return parsed
-        except json.JSONDecodeError:
-            pass
+    # Markdown fence: ```json ... ```
+    if stripped.startswith("```"):
+        stripped = stripped.strip("`").removeprefix("json").strip()
+    # Outermost object: first "{" to last "}"
+    start = stripped.find("{")
+    end = stripped.rfind("}")
+    if start == -1 or end < start:
+        return {}
+    try:
+        parsed = json.loads(stripped[start : end + 1])
+        if isinstance(parsed, dict):
+            return parsed
+    except json.JSONDecodeError:
+        pass
     return {}
 
 
 def _to_float(value: Any, default: float) -> float:
-    if isinstance(value, bool):
+    if value is True or value is False:
         return default
-    if isinstance(value, (int, float)):
+    try:
         f = float(value)
-        return default if (math.isnan(f) or math.isinf(f)) else f
-    if isinstance(value, str):
+    except (TypeError, ValueError):
+        if not isinstance(value, str):
+            return default
+        # LLMs sometimes answer "12%" for a number
         try:
             f = float(value.strip().replace("%", ""))
-            return default if (math.isnan(f) or math.isinf(f)) else f
         except ValueError:
             return default
-    return default
+    return f if math.isfinite(f) else default
 
 
 def _clamp(v: float, lo: float, hi: float) -> float:
@@ -664,8 +1068,8 @@ def _ensure_two_sentences(
     confidence: float,
     has_headlines: bool,
 ) -> str:
-    cleaned = re.sub(r"\s+", " ", text).strip()
-    if not cleaned:
+    sentences = split_sentences(text)
+    if not sentences:
         if has_headlines:
             return (
                 f"{ticker} moved {pct:+.2f}% with headline evidence in the provided input. "
@@ -676,15 +1080,10 @@ def _ensure_two_sentences(
             f"The suggested action is {action} with {confidence:.2f} confidence."
         )
 
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", cleaned) if s.strip()]
     if len(sentences) >= 2:
-        s1 = sentences[0] if sentences[0].endswith((".", "!", "?")) else sentences[0] + "."
-        s2 = sentences[1] if sentences[1].endswith((".", "!", "?")) else sentences[1] + "."
-        return f"{s1} {s2}"
+        return f"{ensure_sentence_end(sentences[0])} {ensure_sentence_end(sentences[1])}"
 
-    first = sentences[0] if sentences else f"{ticker} moved {pct:+.2f}%."
-    if not first.endswith((".", "!", "?")):
-        first += "."
+    first = ensure_sentence_end(sentences[0])
     second = f"The suggested action is {action} with {confidence:.2f} confidence."
     return f"{first} {second}"
 
@@ -700,10 +1099,7 @@ def _fmt_vol(volume: float) -> str:
 
 
 def _log_agent_event(state: AgentState, *, level: str, event: str, stage: str, **kwargs: Any) -> None:
-    path = state.get("_logger_path")
-    run_id = state.get("_run_id")
-    log_level = state.get("_log_level", "INFO")
-    if not path or not run_id:
+    logger = state.get("_run_logger")
+    if logger is None:
         return
-    logger = StructuredLogger(path=Path(path), run_id=run_id, log_level=str(log_level))
     logger.log(level=level, event=event, stage=stage, **kwargs)
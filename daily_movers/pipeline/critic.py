@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 
 from daily_movers.models import Analysis, Enrichment, TickerRow
+from daily_movers.pipeline.critic_core import append_missing, ensure_sentence_end, split_sentences
 
 
 _FORBIDDEN_PATTERNS = [
@@ -12,14 +13,14 @@ _FORBIDDEN_PATTERNS = [
     "internal reasoning",
     "let me think",
 ]
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, _FORBIDDEN_PATTERNS)))
 
 
 def critic_review(*, row: TickerRow, enrichment: Enrichment, analysis: Analysis) -> tuple[Analysis, list[str]]:
     reasons: list[str] = []
 
     why_text = analysis.why_it_moved or ""
-    lower = why_text.lower()
-    if any(pattern in lower for pattern in _FORBIDDEN_PATTERNS):
+    if _FORBIDDEN_RE.search(why_text.lower()):
         analysis.why_it_moved = (
             f"{row.ticker} moved {row.pct_change or 0:+.2f}% based on observed market signals and cited evidence only. "
             "The explanation was sanitized to remove internal reasoning language."
@@ -45,11 +46,8 @@ def critic_review(*, row: TickerRow, enrichment: Enrichment, analysis: Analysis)
         analysis.confidence = 1
         reasons.append("confidence_clipped")
 
-    evidence_urls = [h.url for h in analysis.decision_trace.evidence_used if h.url]
-    for url in evidence_urls:
-        if url not in analysis.provenance_urls:
-            analysis.provenance_urls.append(url)
-            reasons.append("missing_provenance_url_added")
+    if append_missing(analysis.provenance_urls, (h.url for h in analysis.decision_trace.evidence_used)):
+        reasons.append("missing_provenance_url_added")
 
     if not analysis.decision_trace.numeric_signals_used:
         analysis.decision_trace.numeric_signals_used = {
@@ -79,18 +77,11 @@ def critic_review(*, row: TickerRow, enrichment: Enrichment, analysis: Analysis)
 
 
 def _force_two_sentences(text: str, *, ticker: str, pct_change: float) -> str:
-    cleaned = re.sub(r"\s+", " ", text).strip()
-    if not cleaned:
-        return (
-            f"{ticker} moved {pct_change:+.2f}% based on available numerical signals and evidence. "
-            "Evidence coverage was limited, so the interpretation remains cautious."
-        )
-
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", cleaned) if s.strip()]
+    sentences = split_sentences(text)
     if len(sentences) >= 2:
-        return _ensure_sentence_end(sentences[0]) + " " + _ensure_sentence_end(sentences[1])
+        return ensure_sentence_end(sentences[0]) + " " + ensure_sentence_end(sentences[1])
     if len(sentences) == 1:
-        first = _ensure_sentence_end(sentences[0])
+        first = ensure_sentence_end(sentences[0])
         second = "Evidence was limited, so the confidence is treated cautiously."
         return f"{first} {second}"
 
@@ -98,7 +89,3 @@ def _force_two_sentences(text: str, *, ticker: str, pct_change: float) -> str:
         f"{ticker} moved {pct_change:+.2f}% based on available numerical signals and evidence. "
         "Evidence coverage was limited, so the interpretation remains cautious."
     )
-
-
-def _ensure_sentence_end(sentence: str) -> str:
-    return sentence if sentence.endswith((".", "!", "?")) else sentence + "."
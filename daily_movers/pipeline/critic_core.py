@@ -0,0 +1,39 @@
+"""Text and URL helpers shared by the agent's critic node and ``critic_review``.
+
+Both critics normalise ``why_it_moved`` to two sentences and merge provenance
+URLs; keeping the primitives here means one compiled pattern set and one
+whitespace/split pass per call site instead of two diverging copies.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_SENTENCE_END = (".", "!", "?")
+
+
+def split_sentences(text: str) -> list[str]:
+    """Collapse whitespace and split on sentence-ending punctuation."""
+    cleaned = _WHITESPACE_RE.sub(" ", text).strip()
+    if not cleaned:
+        return []
+    return [s for s in (part.strip() for part in _SENT_SPLIT_RE.split(cleaned)) if s]
+
+
+def ensure_sentence_end(sentence: str) -> str:
+    return sentence if sentence.endswith(_SENTENCE_END) else sentence + "."
+
+
+def append_missing(target: list[str], candidates: Iterable[str]) -> list[str]:
+    """Append candidates not already in ``target`` (in order); return the added ones."""
+    seen = set(target)
+    added: list[str] = []
+    for item in candidates:
+        if item and item not in seen:
+            seen.add(item)
+            added.append(item)
+    target.extend(added)
+    return added
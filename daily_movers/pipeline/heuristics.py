@@ -1,6 +1,22 @@
 from __future__ import annotations
 
-from daily_movers.models import Action, Analysis, DecisionTrace, Enrichment, Headline, TickerRow
+import functools
+
+from daily_movers.models import Action, Analysis, DecisionTrace, Enrichment, Headline, TickerRow, quote_url
+
+# Rule names in bit order; every combination is precomputed so the rule list
+# is one table lookup instead of five branches and appends.
+_RULE_NAMES = (
+    "positive_price_impulse",
+    "negative_price_impulse",
+    "extreme_percent_change",
+    "elevated_volume",
+    "no_headline_evidence",
+)
+_RULES_BY_MASK = tuple(
+    tuple(name for bit, name in enumerate(_RULE_NAMES) if mask >> bit & 1)
+    for mask in range(1 << len(_RULE_NAMES))
+)
 
 
 def analyze_with_heuristics(*, row: TickerRow, enrichment: Enrichment) -> Analysis:
@@ -17,17 +33,14 @@ def analyze_with_heuristics(*, row: TickerRow, enrichment: Enrichment) -> Analys
     confidence += 0.05 if volume >= 1_000_000 else 0.0
     confidence = _clamp(confidence, 0.05, 0.95)
 
-    rules: list[str] = []
-    if pct >= 5:
-        rules.append("positive_price_impulse")
-    if pct <= -5:
-        rules.append("negative_price_impulse")
-    if abs(pct) > 15:
-        rules.append("extreme_percent_change")
-    if volume >= 5_000_000:
-        rules.append("elevated_volume")
-    if not has_headlines:
-        rules.append("no_headline_evidence")
+    mask = (
+        (pct >= 5)
+        | (pct <= -5) << 1
+        | (abs(pct) > 15) << 2
+        | (volume >= 5_000_000) << 3
+        | (not has_headlines) << 4
+    )
+    rules = list(_RULES_BY_MASK[mask])
 
     if sentiment >= 0.4 and confidence >= 0.65:
         action = Action.BUY
@@ -67,10 +80,7 @@ def analyze_with_heuristics(*, row: TickerRow, enrichment: Enrichment) -> Analys
         ),
     )
 
-    provenance = [h.url for h in evidence if h.url]
-    quote_url = f"https://finance.yahoo.com/quote/{row.ticker}"
-    if quote_url not in provenance:
-        provenance.append(quote_url)
+    provenance = list(dict.fromkeys([*(h.url for h in evidence if h.url), quote_url(row.ticker)]))
 
     return Analysis(
         why_it_moved=why_it_moved,
@@ -114,9 +124,14 @@ def _build_trace_summary(*, ticker: str, action: Action, pct: float, rule_count:
     )
 
 
+# Quotes and periods are dropped so a headline can't end the sentence early.
+_TITLE_STRIP_TABLE = str.maketrans("", "", "\"'.")
+
+
+# Pure; watchlist re-runs and syndicated headlines repeat the same titles.
+@functools.lru_cache(maxsize=4096)
 def _sanitize_title(title: str) -> str:
-    cleaned = title.replace("\"", "").replace("'", "")
-    cleaned = cleaned.replace(".", "")
+    cleaned = title.translate(_TITLE_STRIP_TABLE)
     return cleaned[:120] if len(cleaned) > 120 else cleaned
 
 
@@ -13,20 +13,85 @@ Important behavior:
     orchestrator.
 """
 
+import asyncio
+import functools
 import json
 import math
 import random
 import re
+import threading
 import time
 from typing import Any
 
 import requests
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from daily_movers.config import AppConfig
 from daily_movers.errors import AnalysisError
-from daily_movers.models import Analysis, Enrichment, Headline, TickerRow
+from daily_movers.models import Analysis, Enrichment, Headline, TickerRow, quote_url
+from daily_movers.pipeline.heuristics import analyze_with_heuristics
 from daily_movers.storage.runs import StructuredLogger
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _LoggedRetry(Retry):
+    """urllib3 Retry that reports each transport retry to the run logger.
+
+    urllib3 rebuilds the policy via ``new()`` on every increment, so the
+    logger is threaded through there.
+    """
+
+    def __init__(self, *args: Any, logger: StructuredLogger | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.logger = logger
+
+    def new(self, **kw: Any) -> _LoggedRetry:
+        kw.setdefault("logger", self.logger)
+        return super().new(**kw)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):  # noqa: ANN001, ANN201
+        # Raises MaxRetryError when the budget is spent, so only real retries log.
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.logger is not None:
+            self.logger.warning(
+                "openai_synthesis_retry",
+                stage="analysis",
+                error_type=error.__class__.__name__ if error else "OpenAIHttpError",
+                error_message=str(error) if error else f"HTTP {response.status if response else 'error'}",
+                retries=len(new_retry.history),
+                retry_after=self.get_retry_after(response) if response is not None else None,
+                url=url,
+            )
+        return new_retry
+
+
+# One transport-level retry for transient statuses, matching the previous
+# two-attempt budget. POST is opted in explicitly: a Responses call has no
+# side effects beyond billing, and these statuses mean it was not served.
+# Each analyzer binds its own logger via ``_HTTP_RETRY.new(logger=...)``.
+_HTTP_RETRY = _LoggedRetry(
+    total=1,
+    backoff_factor=0.5,
+    status_forcelist=(408, 429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_PROMPT_CONSTRAINTS_JSON = json.dumps(
+    {
+        "no_chain_of_thought": True,
+        "why_it_moved_exactly_2_sentences": True,
+        "sentiment_range": [-1, 1],
+        "confidence_range": [0, 1],
+        "allowed_action": ["BUY", "WATCH", "SELL"],
+    },
+    separators=(",", ":"),
+)
+
 
 class OpenAIAnalyzer:
     """Calls OpenAI to synthesize an Analysis object.
@@ -37,11 +102,37 @@ class OpenAIAnalyzer:
     def __init__(self, *, config: AppConfig, logger: StructuredLogger) -> None:
         self.config = config
         self.logger = logger
+        self._session_local = threading.local()
+        # Set once OpenAI rejects the key; later calls fail fast without a request.
+        self._auth_failed = False
 
     @property
     def enabled(self) -> bool:
         return self.config.openai_enabled
 
+    def _get_session(self) -> requests.Session:
+        """Per-thread keep-alive session, as in CachedHttpClient.
+
+        The orchestrator calls synthesize from its worker pool; each worker
+        reuses its own pooled TLS connection to the API instead of opening a
+        new one per ticker. Transient HTTP statuses and connection errors are
+        retried by the adapter (honouring Retry-After, logged as
+        ``openai_synthesis_retry``); synthesize itself only retries unusable
+        model output.
+        """
+        session = getattr(self._session_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=_HTTP_RETRY.new(logger=self.logger),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session_local.session = session
+        return session
+
     def synthesize(self, *, row: TickerRow, enrichment: Enrichment) -> Analysis:
         """Call the OpenAI Responses endpoint and return a validated Analysis.
 
@@ -54,18 +145,16 @@ class OpenAIAnalyzer:
             raise AnalysisError("OPENAI_API_KEY is not configured", stage="analysis", url=None)
 
         url = f"{self.config.openai_base_url.rstrip('/')}/responses"
-        prompt_payload = {
-            "ticker": row.model_dump(),
-            "enrichment": enrichment.model_dump(),
-            "constraints": {
-                "no_chain_of_thought": True,
-                "why_it_moved_exactly_2_sentences": True,
-                "sentiment_range": [-1, 1],
-                "confidence_range": [0, 1],
-                "allowed_action": ["BUY", "WATCH", "SELL"],
-            },
-        }
-        prompt_text = json.dumps(prompt_payload, ensure_ascii=True)
+        if self._auth_failed:
+            raise AnalysisError(_INVALID_KEY_MESSAGE, stage="analysis", url=url)
+        # Serialise the models straight to JSON (one walk each, in pydantic-core)
+        # and splice them into the envelope instead of dump-to-dict + json.dumps.
+        # Null fields are dropped: they add prompt tokens but no evidence.
+        prompt_text = (
+            '{"ticker":' + row.model_dump_json(exclude_none=True)
+            + ',"enrichment":' + enrichment.model_dump_json(exclude_none=True)
+            + ',"constraints":' + _PROMPT_CONSTRAINTS_JSON + "}"
+        )
 
         system_prompt = (
             "You are a financial synthesis model. Use only provided evidence and numeric signals. "
@@ -102,28 +191,38 @@ class OpenAIAnalyzer:
         last_error: Exception | None = None
         for attempt in range(max_attempts):
             try:
-                response = requests.post(
+                response = self._get_session().post(
                     url,
                     headers=headers,
                     json=payload,
                     timeout=self.config.openai_timeout_seconds,
                 )
-                status_code = response.status_code
-                if status_code >= 400:
+                if _is_invalid_api_key(response):
+                    # Retrying (here or for later tickers) can't fix a bad key.
+                    self._auth_failed = True
+                    self.logger.error(
+                        "openai_auth_failed",
+                        stage="analysis",
+                        symbol=row.ticker,
+                        error_type="OpenAIAuthError",
+                        error_message=_INVALID_KEY_MESSAGE,
+                        url=url,
+                    )
+                    raise AnalysisError(_INVALID_KEY_MESSAGE, stage="analysis", url=url)
+                if response.status_code >= 400:
+                    # Transient statuses were already retried by the session's
+                    # adapter; anything left (bad key, quota, exhausted 5xx
+                    # retries) will not improve with another full attempt.
                     safe_error = _safe_openai_error(response)
-                    retryable = status_code in {408, 429, 500, 502, 503, 504}
-                    if retryable and attempt < max_attempts - 1:
-                        self.logger.warning(
-                            "openai_synthesis_retry",
-                            stage="analysis",
-                            symbol=row.ticker,
-                            error_type="OpenAIHttpError",
-                            error_message=safe_error,
-                            retries=attempt,
-                            url=url,
-                        )
-                        _sleep_backoff(attempt=attempt + 1, response=response)
-                        continue
+                    self.logger.warning(
+                        "openai_synthesis_failed",
+                        stage="analysis",
+                        symbol=row.ticker,
+                        error_type="OpenAIHttpError",
+                        error_message=safe_error,
+                        retries=attempt + _transport_retries(response),
+                        url=url,
+                    )
                     raise AnalysisError(
                         safe_error,
                         stage="analysis",
@@ -137,7 +236,7 @@ class OpenAIAnalyzer:
                     row=row,
                     enrichment=enrichment,
                 )
-                analysis = Analysis.model_validate(normalized)
+                analysis = _analysis_adapter().validate_python(normalized)
                 analysis.model_used = f"openai:{self.config.analysis_model}"
                 self.logger.info(
                     "openai_synthesis_success",
@@ -147,6 +246,20 @@ class OpenAIAnalyzer:
                     url=url,
                 )
                 return analysis
+            except AnalysisError:
+                raise
+            except requests.RequestException as exc:
+                # Connection/read failures were already retried by the adapter.
+                self.logger.warning(
+                    "openai_synthesis_failed",
+                    stage="analysis",
+                    symbol=row.ticker,
+                    error_type=exc.__class__.__name__,
+                    error_message=str(exc),
+                    retries=attempt,
+                    url=url,
+                )
+                raise AnalysisError(str(exc), stage="analysis", url=url) from exc
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
                 is_last = attempt == max_attempts - 1
@@ -160,11 +273,66 @@ class OpenAIAnalyzer:
                     url=url,
                 )
                 if not is_last:
-                    _sleep_backoff(attempt=attempt + 1, response=None)
+                    _sleep_backoff(attempt=attempt + 1)
 
         message = str(last_error) if last_error else "unknown synthesis failure"
         raise AnalysisError(message, stage="analysis", url=url)
 
+    async def synthesize_async(self, *, row: TickerRow, enrichment: Enrichment) -> Analysis:
+        """``synthesize`` on a worker thread, so async callers can gather tickers."""
+        return await asyncio.to_thread(self.synthesize, row=row, enrichment=enrichment)
+
+    async def synthesize_many(
+        self,
+        *,
+        rows: list[TickerRow],
+        enrichments: list[Enrichment],
+        max_concurrency: int | None = None,
+    ) -> list[Analysis]:
+        """Synthesize many tickers concurrently; results are in input order.
+
+        At most ``max_concurrency`` requests (default: ``config.max_workers``)
+        are in flight. A ticker whose synthesis fails gets the deterministic
+        heuristic analysis instead, so one bad response never sinks the batch.
+        """
+        if len(rows) != len(enrichments):
+            raise ValueError("rows and enrichments must have the same length")
+
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.max_workers)
+
+        async def _bounded(row: TickerRow, enrichment: Enrichment) -> Analysis:
+            async with semaphore:
+                return await self.synthesize_async(row=row, enrichment=enrichment)
+
+        outcomes = await asyncio.gather(
+            *(_bounded(row, enrichment) for row, enrichment in zip(rows, enrichments)),
+            return_exceptions=True,
+        )
+
+        results: list[Analysis] = []
+        for row, enrichment, outcome in zip(rows, enrichments, outcomes):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                self.logger.warning(
+                    "openai_synthesis_fallback",
+                    stage="analysis",
+                    symbol=row.ticker,
+                    error_type=outcome.__class__.__name__,
+                    error_message=str(outcome),
+                    fallback_used=True,
+                )
+                results.append(analyze_with_heuristics(row=row, enrichment=enrichment))
+            else:
+                results.append(outcome)
+        return results
+
+
+@functools.cache
+def _analysis_adapter() -> TypeAdapter[Analysis]:
+    # Built on first use, not at import: Analysis defers its schema build too.
+    return TypeAdapter(Analysis)
+
 
 def _extract_response_text(response_json: dict[str, Any]) -> str:
     if isinstance(response_json.get("output_text"), str):
@@ -190,16 +358,30 @@ def _extract_json_object(text: str) -> dict[str, Any]:
     except json.JSONDecodeError:
         pass
 
-    match = re.search(r"\{.*\}", stripped, flags=re.DOTALL)
-    if not match:
+    parsed = _find_json_object(stripped)
+    if parsed is None:
         raise ValueError("no JSON object found in model output")
-
-    parsed = json.loads(match.group(0))
-    if not isinstance(parsed, dict):
-        raise ValueError("parsed JSON output is not an object")
     return parsed
 
 
+def _find_json_object(text: str) -> dict[str, Any] | None:
+    """Return the first complete JSON object embedded in ``text``.
+
+    raw_decode walks brace depth and string literals in the C scanner and stops
+    at the end of the object, so trailing prose is ignored and there is no
+    regex backtracking over the whole response.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+            continue
+        return parsed
+    return None
+
+
 def _normalize_analysis_json(
     *,
     json_obj: dict[str, Any],
@@ -207,6 +389,9 @@ def _normalize_analysis_json(
     enrichment: Enrichment,
 ) -> dict[str, Any]:
     normalized: dict[str, Any] = dict(json_obj)
+    ticker = row.ticker
+    pct = row.pct_change or 0.0
+    has_headlines = bool(enrichment.headlines)
 
     raw_sentiment = _coerce_float(normalized.get("sentiment"), 0.0)
     sentiment = _clamp(raw_sentiment, -1.0, 1.0)
@@ -214,10 +399,11 @@ def _normalize_analysis_json(
     confidence = _clamp(_coerce_float(normalized.get("confidence"), 0.6), 0.0, 1.0)
     why_it_moved = _coerce_why_it_moved(
         raw=normalized.get("why_it_moved"),
-        row=row,
+        ticker=ticker,
+        pct=pct,
         action=action,
         confidence=confidence,
-        has_headlines=bool(enrichment.headlines),
+        has_headlines=has_headlines,
     )
 
     trace_raw = normalized.get("decision_trace")
@@ -233,14 +419,14 @@ def _normalize_analysis_json(
     explainability_summary = trace_raw.get("explainability_summary")
     if not isinstance(explainability_summary, str) or not explainability_summary.strip():
         explainability_summary = (
-            f"{row.ticker} is tagged {action} from {(row.pct_change or 0.0):+.2f}% movement "
+            f"{ticker} is tagged {action} from {pct:+.2f}% movement "
             f"with {len(rules_triggered)} triggered rules."
         )
 
     provenance_urls = _coerce_provenance_urls(
         raw=normalized.get("provenance_urls"),
         evidence_used=evidence_used,
-        ticker=row.ticker,
+        ticker=ticker,
     )
 
     normalized["why_it_moved"] = why_it_moved
@@ -261,19 +447,15 @@ def _coerce_float(value: Any, default: float) -> float:
     if isinstance(value, bool):
         return default
     if isinstance(value, (int, float)):
-        if math.isnan(float(value)) or math.isinf(float(value)):
-            return default
-        return float(value)
-    if isinstance(value, str):
-        candidate = value.strip().replace("%", "")
+        parsed = float(value)
+    elif isinstance(value, str):
         try:
-            parsed = float(candidate)
+            parsed = float(value.strip().replace("%", ""))
         except ValueError:
             return default
-        if math.isnan(parsed) or math.isinf(parsed):
-            return default
-        return parsed
-    return default
+    else:
+        return default
+    return parsed if math.isfinite(parsed) else default
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -295,7 +477,8 @@ def _coerce_action(value: Any, *, sentiment: float) -> str:
 def _coerce_why_it_moved(
     *,
     raw: Any,
-    row: TickerRow,
+    ticker: str,
+    pct: float,
     action: str,
     confidence: float,
     has_headlines: bool,
@@ -303,10 +486,10 @@ def _coerce_why_it_moved(
     text = raw.strip() if isinstance(raw, str) else ""
     if not text:
         if has_headlines:
-            text = f"{row.ticker} moved {(row.pct_change or 0.0):+.2f}% with headline evidence in the provided input."
+            text = f"{ticker} moved {pct:+.2f}% with headline evidence in the provided input."
         else:
             text = (
-                f"{row.ticker} moved {(row.pct_change or 0.0):+.2f}% and no fresh headline evidence "
+                f"{ticker} moved {pct:+.2f}% and no fresh headline evidence "
                 "was available in the provided input."
             )
 
@@ -325,44 +508,33 @@ def _coerce_why_it_moved(
     if sentences:
         first = sentences[0]
     else:
-        first = f"{row.ticker} showed {(row.pct_change or 0.0):+.2f}% movement in the latest session."
+        first = f"{ticker} showed {pct:+.2f}% movement in the latest session."
     if not first.endswith((".", "!", "?")):
         first = f"{first}."
     return f"{first} {second}"
 
 
 def _split_sentences(text: str) -> list[str]:
-    pieces = [p.strip() for p in re.split(r"(?<=[.!?])\s+", text.strip()) if p.strip()]
+    pieces = [p.strip() for p in _SENT_SPLIT_RE.split(text.strip()) if p.strip()]
     return pieces
 
 
-def _coerce_evidence_used(raw: Any, *, enrichment: Enrichment) -> list[dict[str, Any]]:
-    evidence: list[dict[str, Any]] = []
-    if isinstance(raw, list):
-        for item in raw:
-            parsed = _coerce_headline(item)
-            if parsed is not None:
-                evidence.append(parsed)
-
+def _coerce_evidence_used(raw: Any, *, enrichment: Enrichment) -> list[Headline]:
+    # Headline is a slotted frozen dataclass; pydantic takes instances as-is
+    # for the DecisionTrace field, so no intermediate dicts are built.
+    evidence = (
+        [parsed for item in raw if (parsed := _coerce_headline(item)) is not None]
+        if isinstance(raw, list)
+        else []
+    )
     if not evidence:
-        for headline in enrichment.headlines[:3]:
-            evidence.append(
-                {
-                    "title": headline.title,
-                    "url": headline.url,
-                    "published_at": headline.published_at,
-                }
-            )
+        evidence = list(enrichment.headlines[:3])
     return evidence
 
 
-def _coerce_headline(raw: Any) -> dict[str, Any] | None:
+def _coerce_headline(raw: Any) -> Headline | None:
     if isinstance(raw, Headline):
-        return {
-            "title": raw.title,
-            "url": raw.url,
-            "published_at": raw.published_at,
-        }
+        return raw
     if not isinstance(raw, dict):
         return None
 
@@ -373,11 +545,11 @@ def _coerce_headline(raw: Any) -> dict[str, Any] | None:
         return None
     if not isinstance(url, str) or not url.strip():
         return None
-    return {
-        "title": title.strip(),
-        "url": url.strip(),
-        "published_at": str(published_at).strip() if published_at is not None else None,
-    }
+    return Headline(
+        title=title.strip(),
+        url=url.strip(),
+        published_at=str(published_at).strip() if published_at is not None else None,
+    )
 
 
 def _coerce_numeric_signals(
@@ -395,13 +567,11 @@ def _coerce_numeric_signals(
         "volume": row.volume,
         "headline_count": len(enrichment.headlines),
     }
+    # base is built fresh per call, so model-provided signals merge into it
+    # directly rather than into a copy.
     if isinstance(raw, dict):
-        merged = dict(base)
-        merged.update(raw)
-        return merged
-
-    if isinstance(raw, list):
-        merged = dict(base)
+        base.update(raw)
+    elif isinstance(raw, list):
         for item in raw:
             if not isinstance(item, dict):
                 continue
@@ -409,11 +579,9 @@ def _coerce_numeric_signals(
             if not isinstance(key, str) or not key.strip():
                 continue
             if "value" in item:
-                merged[key.strip()] = item.get("value")
+                base[key.strip()] = item.get("value")
             elif "metric_value" in item:
-                merged[key.strip()] = item.get("metric_value")
-        return merged
-
+                base[key.strip()] = item.get("metric_value")
     return base
 
 
@@ -437,46 +605,52 @@ def _coerce_rules(raw: Any) -> list[str]:
     return _dedupe_keep_order(results)
 
 
-def _coerce_provenance_urls(*, raw: Any, evidence_used: list[dict[str, Any]], ticker: str) -> list[str]:
-    urls: list[str] = []
-    if isinstance(raw, list):
-        for item in raw:
-            if isinstance(item, str) and item.strip():
-                urls.append(item.strip())
-    for item in evidence_used:
-        url = item.get("url")
-        if isinstance(url, str) and url.strip():
-            urls.append(url.strip())
-    quote_url = f"https://finance.yahoo.com/quote/{ticker}"
-    urls.append(quote_url)
+def _coerce_provenance_urls(*, raw: Any, evidence_used: list[Headline], ticker: str) -> list[str]:
+    urls = (
+        [stripped for item in raw if isinstance(item, str) and (stripped := item.strip())]
+        if isinstance(raw, list)
+        else []
+    )
+    urls.extend(stripped for item in evidence_used if (stripped := item.url.strip()))
+    urls.append(quote_url(ticker))
     return _dedupe_keep_order(urls)
 
 
 def _dedupe_keep_order(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        out.append(value)
-    return out
+    return list(dict.fromkeys(values))
 
 
-def _safe_openai_error(response: requests.Response) -> str:
-    code = response.status_code
+_INVALID_KEY_MESSAGE = "OpenAI authentication failed (invalid API key)"
+
+
+def _error_object(response: requests.Response) -> dict[str, Any] | None:
     try:
         payload = response.json()
     except ValueError:
-        return f"OpenAI API returned HTTP {code}"
-
+        return None
     err_obj = payload.get("error") if isinstance(payload, dict) else None
-    if not isinstance(err_obj, dict):
+    return err_obj if isinstance(err_obj, dict) else None
+
+
+def _is_invalid_api_key(response: requests.Response) -> bool:
+    if response.status_code != 401:
+        return False
+    err_obj = _error_object(response)
+    if err_obj is None:
+        return False
+    message = str(err_obj.get("message") or "").lower()
+    return err_obj.get("code") == "invalid_api_key" or "incorrect api key provided" in message
+
+
+def _safe_openai_error(response: requests.Response) -> str:
+    code = response.status_code
+    err_obj = _error_object(response)
+    if err_obj is None:
         return f"OpenAI API returned HTTP {code}"
 
     message = str(err_obj.get("message") or "").lower()
     if "incorrect api key provided" in message or "invalid_api_key" in message:
-        return "OpenAI authentication failed (invalid API key)"
+        return _INVALID_KEY_MESSAGE
     if "rate limit" in message:
         return "OpenAI request failed due to rate limits"
     if "insufficient_quota" in message:
@@ -484,22 +658,10 @@ def _safe_openai_error(response: requests.Response) -> str:
     return f"OpenAI API returned HTTP {code}"
 
 
-def _sleep_backoff(*, attempt: int, response: requests.Response | None) -> None:
-    delay = min(6.0, 0.5 * (2 ** (attempt - 1)) + random.uniform(0, 0.5))
-    retry_after = _parse_retry_after(response)
-    if retry_after is not None:
-        delay = max(delay, retry_after)
-    time.sleep(delay)
+def _sleep_backoff(*, attempt: int) -> None:
+    time.sleep(min(6.0, 0.5 * (2 ** (attempt - 1)) + random.uniform(0, 0.5)))
 
 
-def _parse_retry_after(response: requests.Response | None) -> float | None:
-    if response is None:
-        return None
-    value = response.headers.get("Retry-After")
-    if not value:
-        return None
-    value = value.strip()
-    try:
-        return float(value)
-    except ValueError:
-        return None
+def _transport_retries(response: requests.Response) -> int:
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    return len(getattr(retries, "history", ()) or ())
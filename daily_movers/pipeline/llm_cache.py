@@ -0,0 +1,66 @@
+"""In-process cache for LLM analyst responses.
+
+Why this exists:
+- Watchlists are often re-run within the hour (UiPath schedules, batch
+  adapter calls in one process) with identical evidence for most tickers.
+- Every repeat would otherwise pay a full chat-completion round trip.
+
+Design:
+- Exact-match only: the key is a SHA-256 over the model, endpoint and the
+  full prompt text, so any change in evidence or numeric signals is a miss.
+- Bounded LRU with a TTL; entries are copied in and out so callers can
+  mutate what they get back.
+- Thread-safe: the orchestrator analyses tickers on a thread pool.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class AnalystResponseCache:
+    def __init__(self, *, max_entries: int = 1024, ttl_seconds: float = 3600.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(value)
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every analyst call in the process.
+analyst_cache = AnalystResponseCache()
@@ -19,12 +19,18 @@ Key behavior:
     OpenAI fallback → heuristics.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
-from dataclasses import dataclass
+import atexit
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed, wait
+from contextlib import contextmanager
+import contextvars
+from dataclasses import asdict, dataclass
+import math
 from pathlib import Path
+from secrets import token_hex
+import threading
 import time
 from typing import Any
-from uuid import uuid4
 
 from daily_movers.config import AppConfig, load_config
 from daily_movers.email.eml_backend import EmlBackend
@@ -39,12 +45,13 @@ from daily_movers.models import (
     RunMeta,
     TickerRow,
     apply_hitl_rules,
+    batch_timestamp,
     utc_now_iso,
 )
 from daily_movers.pipeline.critic import critic_review
 from daily_movers.pipeline.heuristics import analyze_with_heuristics
 from daily_movers.pipeline.llm import OpenAIAnalyzer
-from daily_movers.pipeline.agent import run_agent_analysis
+from daily_movers.pipeline.agent import init_worker as init_agent_worker, run_agent_analysis
 from daily_movers.providers.yahoo_movers import get_movers, get_watchlist_rows
 from daily_movers.providers.yahoo_ticker import enrich_ticker
 from daily_movers.render.excel import write_excel_report
@@ -52,6 +59,12 @@ from daily_movers.render.html import build_digest_html
 from daily_movers.storage.cache import CachedHttpClient
 from daily_movers.storage.runs import StructuredLogger, ensure_run_dir, write_json, write_jsonl
 
+# One worker pool per size, shared by every run in this process.
+_executors: dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+# Enrichment is frozen, so every fallback row can share one empty instance.
+_EMPTY_ENRICHMENT = Enrichment()
+
 
 @dataclass
 class RunRequest:
@@ -63,6 +76,9 @@ class RunRequest:
     watchlist: str | None = None
     out_dir: str = "runs/latest"
     send_email: bool = False
+    # archive.jsonl is the only per-ticker replay record; turning it off saves
+    # one full model dump per row but leaves nothing to replay the run from.
+    write_archive: bool = True
 
 
 def run_daily_movers(*, request: RunRequest, config: AppConfig | None = None) -> RunArtifacts:
@@ -75,11 +91,33 @@ def run_daily_movers(*, request: RunRequest, config: AppConfig | None = None) ->
     - absolute/relative paths to the generated outputs
     """
     cfg = config or load_config()
-    run_id = uuid4().hex[:12]
+    run_id = token_hex(6)
     started_at = utc_now_iso()
 
     out_dir = ensure_run_dir(Path(request.out_dir))
     logger = StructuredLogger(path=out_dir / "run.log", run_id=run_id, log_level=cfg.log_level)
+    try:
+        return _run_pipeline(
+            request=request,
+            cfg=cfg,
+            run_id=run_id,
+            started_at=started_at,
+            out_dir=out_dir,
+            logger=logger,
+        )
+    finally:
+        logger.close()
+
+
+def _run_pipeline(
+    *,
+    request: RunRequest,
+    cfg: AppConfig,
+    run_id: str,
+    started_at: str,
+    out_dir: Path,
+    logger: StructuredLogger,
+) -> RunArtifacts:
     http_client = CachedHttpClient(
         cache_dir=cfg.cache_dir,
         default_ttl_seconds=cfg.cache_ttl_seconds,
@@ -103,135 +141,134 @@ def run_daily_movers(*, request: RunRequest, config: AppConfig | None = None) ->
     )
 
     total_start = time.perf_counter()
-
-    ingest_start = time.perf_counter()
-    ticker_rows = _ingest_rows(request=request, client=http_client, logger=logger)
-    ingest_ms = int((time.perf_counter() - ingest_start) * 1000)
-
-    process_start = time.perf_counter()
-    report_rows = _process_rows(
-        rows=ticker_rows,
-        client=http_client,
-        logger=logger,
-        llm=llm,
-        config=cfg,
-        max_workers=cfg.max_workers,
-    )
-    process_ms = int((time.perf_counter() - process_start) * 1000)
+    timings_ms: dict[str, int] = {}
+
+    with _timed(timings_ms, "ingestion"):
+        ticker_rows = _ingest_rows(request=request, client=http_client, logger=logger)
+
+    with _timed(timings_ms, "processing"), batch_timestamp():
+        report_rows = _process_rows(
+            rows=ticker_rows,
+            client=http_client,
+            logger=logger,
+            llm=llm,
+            config=cfg,
+            max_workers=cfg.max_workers,
+        )
+    # Per-ticker agent events are logged asynchronously; land them before the
+    # later stages so run.log stays in stage order.
+    logger.flush()
 
     if request.mode == "movers":
-        report_rows.sort(
-            key=lambda r: (
-                r.ticker.pct_change if r.ticker.pct_change is not None else float("-inf"),
-                r.ticker.volume if r.ticker.volume is not None else float("-inf"),
-            ),
-            reverse=True,
-        )
+        report_rows = _sort_by_move(report_rows)
 
     archive_path = out_dir / "archive.jsonl"
-    write_jsonl(
-        archive_path,
-        [
-            {
-                "run_id": run_id,
-                "requested_date": request.date,
-                "mode": request.mode,
-                "region": request.region,
-                **row.to_archive_dict(),
-            }
-            for row in report_rows
-        ],
-    )
+    if request.write_archive:
+        write_jsonl(
+            archive_path,
+            (
+                {
+                    "run_id": run_id,
+                    "requested_date": request.date,
+                    "mode": request.mode,
+                    "region": request.region,
+                    **row.to_archive_dict(),
+                }
+                for row in report_rows
+            ),
+        )
 
-    render_start = time.perf_counter()
-    digest_html = build_digest_html(
-        rows=report_rows,
-        run_meta={
-            "run_id": run_id,
-            "requested_date": request.date,
-            "mode": request.mode,
-            "region": request.region,
-            "source": request.source,
-            "top": request.top,
-        },
-    )
-    digest_path = out_dir / "digest.html"
-    digest_path.write_text(digest_html, encoding="utf-8")
-
-    excel_path = out_dir / "report.xlsx"
-    write_excel_report(rows=report_rows, out_path=excel_path)
-    render_ms = int((time.perf_counter() - render_start) * 1000)
-
-    email_start = time.perf_counter()
-    from_email = cfg.from_email or "daily-movers@localhost"
-    to_email = cfg.self_email or from_email
-    subject = f"Daily Movers Digest - {request.date}"
-    eml_message = eml_backend.build_message(
-        subject=subject,
-        html_body=digest_html,
-        from_email=from_email,
-        to_email=to_email,
-    )
-    eml_path = out_dir / "digest.eml"
-    eml_backend.write_message(message=eml_message, out_path=eml_path)
-
-    email_meta: dict[str, Any] = {
-        "attempted": bool(request.send_email),
-        "sent": False,
-        "status": "eml_only",
-        "error": None,
-        "backend": "eml",
-    }
+    with _timed(timings_ms, "rendering"):
+        # The workbook and the digest read the same rows but write separate
+        # files; build the workbook on a side thread so its zip compression
+        # overlaps the HTML templating here.
+        excel_path = out_dir / "report.xlsx"
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="daily-movers-render") as render_pool:
+            excel_future = render_pool.submit(write_excel_report, rows=report_rows, out_path=excel_path)
+            digest_html = build_digest_html(
+                rows=report_rows,
+                run_meta={
+                    "run_id": run_id,
+                    "requested_date": request.date,
+                    "mode": request.mode,
+                    "region": request.region,
+                    "source": request.source,
+                    "top": request.top,
+                },
+            )
+            digest_path = out_dir / "digest.html"
+            digest_path.write_text(digest_html, encoding="utf-8")
+            excel_future.result()
+
+    with _timed(timings_ms, "email"):
+        from_email = cfg.from_email or "daily-movers@localhost"
+        to_email = cfg.self_email or from_email
+        subject = f"Daily Movers Digest - {request.date}"
+        eml_message = eml_backend.build_message(
+            subject=subject,
+            html_body=digest_html,
+            from_email=from_email,
+            to_email=to_email,
+        )
+        eml_path = out_dir / "digest.eml"
+        eml_backend.write_message(message=eml_message, out_path=eml_path)
+
+        email_meta: dict[str, Any] = {
+            "attempted": bool(request.send_email),
+            "sent": False,
+            "status": "eml_only",
+            "error": None,
+            "backend": "eml",
+        }
 
-    if request.send_email:
-        if smtp_backend.can_send():
-            try:
-                smtp_backend.send_message(message=eml_message)
-                email_meta = {
-                    "attempted": True,
-                    "sent": True,
-                    "status": "sent",
-                    "error": None,
-                    "backend": "smtp",
-                }
-            except EmailDeliveryError as exc:
+        if request.send_email:
+            if smtp_backend.can_send():
+                try:
+                    smtp_backend.send_message(message=eml_message)
+                    email_meta = {
+                        "attempted": True,
+                        "sent": True,
+                        "status": "sent",
+                        "error": None,
+                        "backend": "smtp",
+                    }
+                except EmailDeliveryError as exc:
+                    email_meta = {
+                        "attempted": True,
+                        "sent": False,
+                        "status": "failed",
+                        "error": str(exc),
+                        "backend": "smtp",
+                    }
+                    logger.error(
+                        "email_send_failed",
+                        stage="email",
+                        error_type=exc.__class__.__name__,
+                        error_message=str(exc),
+                    )
+            else:
                 email_meta = {
                     "attempted": True,
                     "sent": False,
-                    "status": "failed",
-                    "error": str(exc),
+                    "status": "skipped_missing_credentials",
+                    "error": "SMTP credentials not fully configured",
                     "backend": "smtp",
                 }
-                logger.error(
-                    "email_send_failed",
+                logger.warning(
+                    "email_send_skipped",
                     stage="email",
-                    error_type=exc.__class__.__name__,
-                    error_message=str(exc),
+                    error_type="MissingCredentials",
+                    error_message="SMTP credentials not fully configured",
                 )
-        else:
-            email_meta = {
-                "attempted": True,
-                "sent": False,
-                "status": "skipped_missing_credentials",
-                "error": "SMTP credentials not fully configured",
-                "backend": "smtp",
-            }
-            logger.warning(
-                "email_send_skipped",
-                stage="email",
-                error_type="MissingCredentials",
-                error_message="SMTP credentials not fully configured",
-            )
-    email_ms = int((time.perf_counter() - email_start) * 1000)
 
     summary = _build_summary(
         report_rows=report_rows,
         email_meta=email_meta,
         openai_attempted=llm.enabled,
     )
-    status = _resolve_run_status(report_rows=report_rows, email_meta=email_meta)
+    status = _resolve_run_status(summary=summary, email_meta=email_meta)
     ended_at = utc_now_iso()
-    total_ms = int((time.perf_counter() - total_start) * 1000)
+    timings_ms["total"] = _elapsed_ms(total_start)
 
     run_meta = RunMeta(
         run_id=run_id,
@@ -246,17 +283,11 @@ def run_daily_movers(*, request: RunRequest, config: AppConfig | None = None) ->
         status=status,
         summary=summary,
         email=email_meta,
-        timings_ms={
-            "ingestion": ingest_ms,
-            "processing": process_ms,
-            "rendering": render_ms,
-            "email": email_ms,
-            "total": total_ms,
-        },
+        timings_ms=timings_ms,
     )
 
     run_json_path = out_dir / "run.json"
-    write_json(run_json_path, run_meta.model_dump())
+    write_json(run_json_path, asdict(run_meta))
 
     logger.info(
         "run_completed",
@@ -271,13 +302,45 @@ def run_daily_movers(*, request: RunRequest, config: AppConfig | None = None) ->
         "report_xlsx": str(excel_path),
         "digest_html": str(digest_path),
         "digest_eml": str(eml_path),
-        "archive_jsonl": str(archive_path),
-        "run_json": str(run_json_path),
-        "run_log": str(out_dir / "run.log"),
     }
+    if request.write_archive:
+        paths["archive_jsonl"] = str(archive_path)
+    paths["run_json"] = str(run_json_path)
+    paths["run_log"] = str(out_dir / "run.log")
     return RunArtifacts(status=status, summary=summary, paths=paths)
 
 
+@contextmanager
+def _timed(timings_ms: dict[str, int], phase: str) -> Iterator[None]:
+    """Record the wall time of the block under ``timings_ms[phase]``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings_ms[phase] = _elapsed_ms(start)
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+def _sort_by_move(report_rows: list[ReportRow]) -> list[ReportRow]:
+    """Order rows by pct_change then volume, descending; missing values sort last.
+
+    Keys are materialised once and indices sorted against them, so each
+    comparison is a plain tuple compare; ``reverse=True`` keeps ties stable.
+    """
+    keys = [
+        (
+            pct if (pct := row.ticker.pct_change) is not None else -math.inf,
+            vol if (vol := row.ticker.volume) is not None else -math.inf,
+        )
+        for row in report_rows
+    ]
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
+    return [report_rows[i] for i in order]
+
+
 def _ingest_rows(
     *,
     request: RunRequest,
@@ -333,74 +396,94 @@ def _process_rows(
 
     results: list[ReportRow | None] = [None] * len(rows)
 
+    # The LangGraph executor is only used with an LLM configured; compile it
+    # here so worker threads don't race to build it on their first ticker.
+    if config.openai_api_key:
+        init_agent_worker()
+
     # Per-ticker processing is embarrassingly parallel (HTTP-bound), so we use a
     # thread pool. A separate per-host semaphore in CachedHttpClient prevents
-    # hammering Yahoo with too many concurrent requests.
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_idx = {
-            executor.submit(_process_single_row, idx, row, client, logger, llm, config): idx
-            for idx, row in enumerate(rows)
-        }
-        per_row_timeout = max(60, config.request_timeout_seconds * 6)
-        batches = max(1, (len(rows) + max_workers - 1) // max_workers)
-        overall_timeout = per_row_timeout * batches
-        completed: set[int] = set()
-        try:
-            for future in as_completed(future_to_idx, timeout=overall_timeout):
-                idx = future_to_idx[future]
-                try:
-                    results[idx] = future.result()
-                except Exception as exc:  # noqa: BLE001
-                    fallback_row = rows[idx]
-                    analysis = analyze_with_heuristics(
-                        row=fallback_row,
-                        enrichment=Enrichment(),
-                    )
-                    analysis.errors.append(
-                        ErrorInfo(
-                            stage="analysis",
-                            error_type=exc.__class__.__name__,
-                            error_message=str(exc),
-                        )
-                    )
-                    report = ReportRow(
-                        ticker=fallback_row,
-                        enrichment=Enrichment(),
-                        analysis=analysis,
-                        status="partial",
-                        needs_review=True,
-                        needs_review_reason=["processing_exception"],
-                    )
-                    results[idx] = apply_hitl_rules(report)
-                completed.add(idx)
-        except TimeoutError:
-            for idx, row in enumerate(rows):
-                if idx in completed:
-                    continue
-                analysis = analyze_with_heuristics(
-                    row=row,
-                    enrichment=Enrichment(),
-                )
-                analysis.errors.append(
-                    ErrorInfo(
-                        stage="analysis",
-                        error_type="TimeoutError",
-                        error_message="processing timed out",
-                    )
+    # hammering Yahoo with too many concurrent requests. The pool outlives the
+    # run so repeated in-process runs don't respawn their worker threads.
+    executor = _get_executor(max_workers)
+    # Set on timeout so rows still running stop at their next stage boundary.
+    cancelled = threading.Event()
+    future_to_idx = {
+        # Each task runs in a copy of this context so it sees the run's batch_timestamp.
+        executor.submit(
+            contextvars.copy_context().run, _process_single_row, idx, row, client, logger, llm, config, cancelled
+        ): idx
+        for idx, row in enumerate(rows)
+    }
+    per_row_timeout = max(60, config.request_timeout_seconds * 6)
+    batches = max(1, (len(rows) + max_workers - 1) // max_workers)
+    overall_timeout = per_row_timeout * batches
+    completed: set[int] = set()
+    try:
+        for future in as_completed(future_to_idx, timeout=overall_timeout):
+            idx = future_to_idx[future]
+            try:
+                results[idx] = future.result()
+            except Exception as exc:  # noqa: BLE001
+                results[idx] = _fallback_report(
+                    rows[idx],
+                    error_type=exc.__class__.__name__,
+                    error_message=str(exc),
+                    reason="processing_exception",
                 )
-                report = ReportRow(
-                    ticker=row,
-                    enrichment=Enrichment(),
-                    analysis=analysis,
-                    status="partial",
-                    needs_review=True,
-                    needs_review_reason=["processing_timeout"],
+            completed.add(idx)
+    except TimeoutError:
+        # The shared pool isn't shut down here, so drop queued work explicitly,
+        # tell running rows to stop, and wait for them: a straggler must not log
+        # after the run closes its logger or hold a worker into the next run.
+        cancelled.set()
+        for future in future_to_idx:
+            future.cancel()
+        wait(future_to_idx)
+        for idx, row in enumerate(rows):
+            if idx not in completed:
+                results[idx] = _fallback_report(
+                    row,
+                    error_type="TimeoutError",
+                    error_message="processing timed out",
+                    reason="processing_timeout",
                 )
-                results[idx] = apply_hitl_rules(report)
 
     return [r for r in results if r is not None]
 
 
+def _fallback_report(row: TickerRow, *, error_type: str, error_message: str, reason: str) -> ReportRow:
+    """Heuristic-only row for a ticker whose processing raised or timed out."""
+    analysis = analyze_with_heuristics(row=row, enrichment=_EMPTY_ENRICHMENT)
+    analysis.errors.append(ErrorInfo(stage="analysis", error_type=error_type, error_message=error_message))
+    report = ReportRow.build_trusted(
+        ticker=row,
+        enrichment=_EMPTY_ENRICHMENT,
+        analysis=analysis,
+        status="partial",
+        needs_review=True,
+        needs_review_reason=[reason],
+    )
+    return apply_hitl_rules(report)
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="daily-movers")
+            _executors[max_workers] = executor
+        return executor
+
+
+@atexit.register
+def _shutdown_executors() -> None:
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executors.clear()
+
+
 def _process_single_row(
     idx: int,
     row: TickerRow,
@@ -408,13 +491,18 @@ def _process_single_row(
     logger: StructuredLogger,
     llm: OpenAIAnalyzer,
     config: AppConfig,
+    cancelled: threading.Event | None = None,
 ) -> ReportRow:
-    logger.info("ticker_processing_started", stage="orchestrator", symbol=row.ticker, index=idx)
+    # At DEBUG every step is logged; otherwise the happy-path info lines are
+    # folded into one ticker_processed record (warnings are always logged).
+    detailed = logger.is_enabled("debug")
+    if detailed:
+        logger.info("ticker_processing_started", stage="orchestrator", symbol=row.ticker, index=idx)
 
     enrichment = enrich_ticker(row=row, client=client, logger=logger)
-    heuristic_analysis = analyze_with_heuristics(row=row, enrichment=enrichment)
-    analysis = heuristic_analysis
-    recommendation_tags: list[str] = []
+    _raise_if_cancelled(cancelled)
+    # Heuristics are only computed when neither model path produced an analysis.
+    analysis: Analysis | None = None
 
     # Analysis strategy (in priority order):
     # 1) LangGraph agent: multi-node reasoning with guardrails. It may use OpenAI
@@ -436,15 +524,13 @@ def _process_single_row(
         )
         analysis = agent_analysis
         agent_succeeded = True
-        # Tags are derived from the final analysis; this is intentionally
-        # deterministic so Excel/HTML stay consistent across model variants.
-        recommendation_tags = _derive_recommendation_tags(row, analysis)
-        logger.info(
-            "agent_analysis_used",
-            stage="analysis",
-            symbol=row.ticker,
-            model_used=analysis.model_used,
-        )
+        if detailed:
+            logger.info(
+                "agent_analysis_used",
+                stage="analysis",
+                symbol=row.ticker,
+                model_used=analysis.model_used,
+            )
     except Exception as exc:
         logger.warning(
             "agent_analysis_failed",
@@ -455,13 +541,14 @@ def _process_single_row(
             fallback_used=True,
         )
 
+    _raise_if_cancelled(cancelled)
+
     # --- Path 2: Raw OpenAI fallback (secondary) ---
     if not agent_succeeded and llm.enabled:
         try:
             analysis = llm.synthesize(row=row, enrichment=enrichment)
-            recommendation_tags = _derive_recommendation_tags(row, analysis)
         except AnalysisError as exc:
-            analysis = heuristic_analysis
+            analysis = analyze_with_heuristics(row=row, enrichment=enrichment)
             if "openai_fallback_used" not in analysis.decision_trace.rules_triggered:
                 analysis.decision_trace.rules_triggered.append("openai_fallback_used")
             logger.warning(
@@ -474,13 +561,20 @@ def _process_single_row(
                 fallback_used=True,
             )
 
-    # --- Path 3: Heuristics already assigned as default ---
-    if not recommendation_tags:
-        recommendation_tags = _derive_recommendation_tags(row, analysis)
+    _raise_if_cancelled(cancelled)
+
+    # --- Path 3: Heuristics (baseline) ---
+    if analysis is None:
+        analysis = analyze_with_heuristics(row=row, enrichment=enrichment)
+
+    # Tags are derived once, from whichever analysis won, before the critic
+    # edits it; this is intentionally deterministic so Excel/HTML stay
+    # consistent across model variants.
+    recommendation_tags = _derive_recommendation_tags(row, analysis)
 
     analysis, critic_flags = critic_review(row=row, enrichment=enrichment, analysis=analysis)
 
-    report = ReportRow(
+    report = ReportRow.build_trusted(
         ticker=row,
         enrichment=enrichment,
         analysis=analysis,
@@ -489,19 +583,40 @@ def _process_single_row(
         status="ok",
     )
     report = apply_hitl_rules(report)
-    if report.all_errors():
+    if report.has_any_errors():
         report.status = "partial"
 
-    logger.info(
-        "ticker_processing_completed",
-        stage="orchestrator",
-        symbol=row.ticker,
-        status=report.status,
-        needs_review=report.needs_review,
-    )
+    if detailed:
+        logger.info(
+            "ticker_processing_completed",
+            stage="orchestrator",
+            symbol=row.ticker,
+            status=report.status,
+            needs_review=report.needs_review,
+        )
+    else:
+        logger.info(
+            "ticker_processed",
+            stage="orchestrator",
+            symbol=row.ticker,
+            index=idx,
+            status=report.status,
+            needs_review=report.needs_review,
+            model_used=report.analysis.model_used,
+            agent_used=agent_succeeded,
+        )
     return report
 
 
+class _RowCancelled(Exception):
+    """Raised inside a worker once its run has timed out; the result is discarded."""
+
+
+def _raise_if_cancelled(cancelled: threading.Event | None) -> None:
+    if cancelled is not None and cancelled.is_set():
+        raise _RowCancelled
+
+
 def _derive_recommendation_tags(row: TickerRow, analysis: Analysis) -> list[str]:
     """Derive recommendation tags from analysis results."""
     tags: list[str] = []
@@ -530,29 +645,35 @@ def _build_summary(
     email_meta: dict[str, Any],
     openai_attempted: bool,
 ) -> dict[str, Any]:
-    error_rows = sum(1 for row in report_rows if row.all_errors())
-    needs_review = sum(1 for row in report_rows if row.needs_review)
-    fallback_rows = sum(1 for row in report_rows if row.ticker.ingestion_fallback_used)
-    openai_used_rows = sum(
-        1 for row in report_rows
-        if "openai" in (row.analysis.model_used or "")
-    )
-    openai_fallback_rows = sum(
-        1 for row in report_rows if "openai_fallback_used" in row.analysis.decision_trace.rules_triggered
-    )
-    langgraph_rows = sum(1 for row in report_rows if "langgraph" in (row.analysis.model_used or ""))
-    top_pick_rows = sum(1 for row in report_rows if "top_pick_candidate" in row.recommendation_tags)
-    most_potential_rows = sum(1 for row in report_rows if "most_potential_candidate" in row.recommendation_tags)
-
-    # Identify the single top pick and most potential
+    # One pass over the rows: every counter and both picks are updated together.
+    error_rows = needs_review = fallback_rows = 0
+    openai_used_rows = openai_fallback_rows = langgraph_rows = 0
+    top_pick_rows = most_potential_rows = 0
     top_pick = None
     most_potential = None
     for row in report_rows:
-        if "top_pick_candidate" in row.recommendation_tags:
-            if top_pick is None or row.analysis.confidence > top_pick.analysis.confidence:
+        analysis = row.analysis
+        model_used = analysis.model_used or ""
+        tags = row.recommendation_tags
+        if row.has_any_errors():
+            error_rows += 1
+        if row.needs_review:
+            needs_review += 1
+        if row.ticker.ingestion_fallback_used:
+            fallback_rows += 1
+        if "openai" in model_used:
+            openai_used_rows += 1
+        if "langgraph" in model_used:
+            langgraph_rows += 1
+        if "openai_fallback_used" in analysis.decision_trace.rules_triggered:
+            openai_fallback_rows += 1
+        if "top_pick_candidate" in tags:
+            top_pick_rows += 1
+            if top_pick is None or analysis.confidence > top_pick.analysis.confidence:
                 top_pick = row
-        if "most_potential_candidate" in row.recommendation_tags:
-            if most_potential is None or (row.analysis.sentiment > most_potential.analysis.sentiment):
+        if "most_potential_candidate" in tags:
+            most_potential_rows += 1
+            if most_potential is None or analysis.sentiment > most_potential.analysis.sentiment:
                 most_potential = row
 
     return {
@@ -573,10 +694,10 @@ def _build_summary(
     }
 
 
-def _resolve_run_status(*, report_rows: list[ReportRow], email_meta: dict[str, Any]) -> str:
-    if not report_rows:
+def _resolve_run_status(*, summary: dict[str, Any], email_meta: dict[str, Any]) -> str:
+    if not summary["processed"]:
         return "failed"
-    has_errors = any(row.all_errors() for row in report_rows)
+    has_errors = summary["error_rows"] > 0
     email_failed = bool(email_meta.get("attempted")) and not bool(email_meta.get("sent")) and email_meta.get("status") == "failed"
     if has_errors or email_failed:
         return "partial_success"
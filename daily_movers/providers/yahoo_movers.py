@@ -25,7 +25,7 @@ from urllib.parse import quote
 import yaml
 from bs4 import BeautifulSoup
 
-from daily_movers.config import REGION_UNIVERSES
+from daily_movers.config import MOVERS_SOURCES, REGION_UNIVERSES
 from daily_movers.errors import HTTPFetchError, IngestionError
 from daily_movers.models import ErrorInfo, TickerRow
 from daily_movers.storage.cache import HttpClient
@@ -48,7 +48,7 @@ def get_movers(
 ) -> list[TickerRow]:
     normalized_region = region.lower()
     normalized_source = (source or "auto").lower()
-    if normalized_source not in {"auto", "most-active", "universe"}:
+    if normalized_source not in MOVERS_SOURCES:
         raise IngestionError(
             f"unsupported movers source: {source}",
             stage="ingestion",
@@ -74,7 +74,7 @@ def get_movers(
         )
 
     rows = build_rows_from_symbols(
-        symbols=universe,
+        symbols=list(universe),
         top_n=top_n,
         source=f"yahoo_chart_{normalized_region}_universe",
         market=normalized_region,
@@ -144,6 +144,7 @@ def load_watchlist_symbols(path: Path) -> list[str]:
     # Normalize symbols to a conservative Yahoo-compatible format. We preserve
     # order and deduplicate.
     normalized: list[str] = []
+    seen: set[str] = set()
     for item in symbols:
         if isinstance(item, str):
             symbol = item.strip().upper()
@@ -151,7 +152,8 @@ def load_watchlist_symbols(path: Path) -> list[str]:
             symbol = str(item["symbol"]).strip().upper()
         else:
             continue
-        if symbol and _TICKER_RE.fullmatch(symbol) and symbol not in normalized:
+        if symbol and symbol not in seen and _TICKER_RE.fullmatch(symbol):
+            seen.add(symbol)
             normalized.append(symbol)
 
     if not normalized:
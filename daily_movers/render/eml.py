@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from email.generator import BytesGenerator
 from email.message import EmailMessage
 from email.policy import SMTP
 from pathlib import Path
@@ -16,6 +18,21 @@ def build_digest_eml(*, subject: str, html_body: str, from_email: str, to_email:
 
 
 def write_eml_file(*, message: EmailMessage, out_path: Path) -> None:
+    """Serialize message straight to disk, then atomically move it into place.
+
+    BytesGenerator writes the MIME parts as it walks them, so the full encoded
+    message is never held in memory as one bytes object. The temp file is
+    fsynced before the rename so a crash can't leave a truncated digest.eml,
+    and removed if serialisation fails.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("wb") as f:
-        f.write(message.as_bytes(policy=SMTP))
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            BytesGenerator(f, policy=SMTP).flatten(message)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from pathlib import Path
 
 from openpyxl import Workbook
@@ -7,7 +8,7 @@ from openpyxl.formatting.rule import ColorScaleRule
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
-from daily_movers.models import ReportRow
+from daily_movers.models import ReportRow, quote_url
 
 
 _HEADERS = [
@@ -43,6 +44,34 @@ _HEADERS = [
     "Model Used",
     "Errors",
 ]
+# Contiguous runs of to_flat_dict keys in column order, picked in one C call
+# each instead of a flat.get() per cell. Keep in sync with _HEADERS.
+_PRICE_TO_SENTIMENT = itemgetter(
+    "open_price",
+    "close_price",
+    "price",
+    "abs_change",
+    "pct_change",
+    "volume",
+    "currency",
+    "exchange",
+    "sector",
+    "industry",
+    "earnings_date",
+    "action",
+    "confidence",
+    "sentiment",
+)
+_REVIEW_TO_HEADLINE = itemgetter("needs_review_reason", "recommendation_tags", "why_it_moved", "top_headline")
+_TRACE_TO_PROVENANCE = itemgetter(
+    "decision_trace",
+    "rules_triggered",
+    "evidence_titles",
+    "numeric_signals",
+    "provenance_urls",
+)
+_TICKER_COL = _HEADERS.index("Ticker") + 1
+_HEADLINE_URL_COL = _HEADERS.index("Headline URL") + 1
 
 
 def write_excel_report(*, rows: list[ReportRow], out_path: Path) -> None:
@@ -68,55 +97,32 @@ def write_excel_report(*, rows: list[ReportRow], out_path: Path) -> None:
 
     for row_idx, report_row in enumerate(rows, start=2):
         flat = report_row.to_flat_dict()
-        quote_url = f"https://finance.yahoo.com/quote/{flat['ticker']}"
-        top_headline_url = flat.get("headline_url")
-        trend_points = flat.get("trend_points") or []
-        trend_ascii = _ascii_sparkline(trend_points)
-        market = _detect_market_label(flat.get("ticker", ""), report_row.ticker.market)
+        ticker_quote_url = quote_url(flat["ticker"])
+        top_headline_url = flat["headline_url"]
+        trend_ascii = _ascii_sparkline(flat["trend_points"] or [])
+        market = _detect_market_label(flat["ticker"], report_row.ticker.market)
 
         values = [
-            flat.get("ticker"),
-            flat.get("name"),
+            flat["ticker"],
+            flat["name"],
             market,
-            flat.get("open_price"),
-            flat.get("close_price"),
-            flat.get("price"),
-            flat.get("abs_change"),
-            flat.get("pct_change"),
-            flat.get("volume"),
-            flat.get("currency"),
-            flat.get("exchange"),
-            flat.get("sector"),
-            flat.get("industry"),
-            flat.get("earnings_date"),
-            flat.get("action"),
-            flat.get("confidence"),
-            flat.get("sentiment"),
-            "YES" if flat.get("needs_review") else "NO",
-            flat.get("needs_review_reason"),
-            flat.get("recommendation_tags"),
-            flat.get("why_it_moved"),
-            flat.get("top_headline"),
+            *_PRICE_TO_SENTIMENT(flat),
+            "YES" if flat["needs_review"] else "NO",
+            *_REVIEW_TO_HEADLINE(flat),
             top_headline_url,
             trend_ascii,
-            flat.get("decision_trace"),
-            flat.get("rules_triggered"),
-            flat.get("evidence_titles"),
-            flat.get("numeric_signals"),
-            flat.get("provenance_urls"),
+            *_TRACE_TO_PROVENANCE(flat),
             report_row.analysis.model_used,
-            flat.get("errors"),
+            flat["errors"],
         ]
 
         ws.append(values)
 
-        ticker_col = _HEADERS.index("Ticker") + 1
-        ticker_cell = ws.cell(row=row_idx, column=ticker_col)
-        ticker_cell.hyperlink = quote_url
+        ticker_cell = ws.cell(row=row_idx, column=_TICKER_COL)
+        ticker_cell.hyperlink = ticker_quote_url
         ticker_cell.style = "Hyperlink"
 
-        headline_url_col = _HEADERS.index("Headline URL") + 1
-        headline_url_cell = ws.cell(row=row_idx, column=headline_url_col)
+        headline_url_cell = ws.cell(row=row_idx, column=_HEADLINE_URL_COL)
         if top_headline_url and _is_safe_url(str(top_headline_url)):
             headline_url_cell.hyperlink = str(top_headline_url)
             headline_url_cell.style = "Hyperlink"
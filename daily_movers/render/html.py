@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import html
+from collections import Counter
 from urllib.parse import quote, urlparse
 from typing import Any
 
-from daily_movers.models import ReportRow
+from daily_movers.models import Action, ReportRow, quote_url
 
 
 def build_digest_html(*, rows: list[ReportRow], run_meta: dict[str, Any]) -> str:
@@ -45,9 +46,10 @@ def build_digest_html(*, rows: list[ReportRow], run_meta: dict[str, Any]) -> str
 
     processed = len(rows)
     needs_review = sum(1 for row in rows if row.needs_review)
-    action_buy = sum(1 for row in rows if row.analysis.action.value == "BUY")
-    action_watch = sum(1 for row in rows if row.analysis.action.value == "WATCH")
-    action_sell = sum(1 for row in rows if row.analysis.action.value == "SELL")
+    action_counts = Counter(row.analysis.action for row in rows)
+    action_buy = action_counts[Action.BUY]
+    action_watch = action_counts[Action.WATCH]
+    action_sell = action_counts[Action.SELL]
     avg_confidence = (sum(row.analysis.confidence for row in rows) / processed) if processed else 0.0
     langgraph_rows = sum(1 for row in rows if "langgraph" in (row.analysis.model_used or ""))
 
@@ -835,7 +837,7 @@ def _build_table_row(row: ReportRow, idx: int) -> str:
 
     ticker_raw = str(flat.get("ticker") or "")
     ticker = html.escape(ticker_raw)
-    ticker_url = f"https://finance.yahoo.com/quote/{quote(ticker_raw, safe='')}"
+    ticker_url = quote_url(quote(ticker_raw, safe=''))
     company = html.escape(str(flat.get("name") or "Unknown"))
     pct = float(flat.get("pct_change") or 0.0)
     price_val = _to_float(flat.get("price"))
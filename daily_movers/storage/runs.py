@@ -1,13 +1,29 @@
 from __future__ import annotations
 
 import json
+import queue
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from threading import Lock
-from typing import Any
+from threading import Lock, Thread
+from typing import Any, TextIO
 
 from daily_movers.models import utc_now_iso
 
+# Pending async log records per logger; beyond this callers write inline.
+_ASYNC_QUEUE_SIZE = 4096
+# run.log (held open per logger) and archive.jsonl are written through this
+# buffer so per-row records batch into few write syscalls.
+_WRITE_BUFFER_SIZE = 1 << 16
+# Shared encoders for log lines, archive rows and run.json. orjson isn't a
+# dependency here, so these stay stdlib; building them once skips the
+# per-call encoder construction json.dump does for non-default kwargs.
+_LINE_ENCODER = json.JSONEncoder(ensure_ascii=True)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=True)
+# Queued by ``close`` to stop the async writer thread.
+_STOP = object()
+
 
 @dataclass
 class StructuredLogger:
@@ -19,8 +35,72 @@ class StructuredLogger:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = Lock()
         self._min_level = _level_to_int(self.log_level)
+        self._queue: queue.Queue[Any] | None = None
+        self._writer: Thread | None = None
+        self._queue_lock = Lock()
+        self._fh: TextIO | None = None
 
     def log(
+        self,
+        *,
+        level: str,
+        event: str,
+        stage: str,
+        **fields: Any,
+    ) -> None:
+        payload = self._payload(level=level, event=event, stage=stage, **fields)
+        if payload is not None:
+            self._write([payload])
+
+    def log_async(
+        self,
+        *,
+        level: str,
+        event: str,
+        stage: str,
+        **fields: Any,
+    ) -> None:
+        """Like ``log`` but hands the write to a background thread.
+
+        The record (including its timestamp) is built on the caller's thread;
+        serialisation and file I/O happen on the writer. If the queue is full
+        the record is written inline instead, so a slow disk applies
+        backpressure rather than growing memory without bound.
+        """
+        payload = self._payload(level=level, event=event, stage=stage, **fields)
+        if payload is None:
+            return
+        try:
+            self._writer_queue().put_nowait(payload)
+        except queue.Full:
+            self._write([payload])
+
+    def flush(self) -> None:
+        """Block until every record written so far (sync or async) is on disk."""
+        if self._queue is not None:
+            self._queue.join()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        """Stop the async writer, flush, and release the log file.
+
+        A later write reopens the file (and a later ``log_async`` restarts the
+        writer), so closing is safe even if a straggler logs afterwards.
+        """
+        with self._queue_lock:
+            q, writer = self._queue, self._writer
+            self._queue = self._writer = None
+        if q is not None and writer is not None:
+            q.put(_STOP)
+            writer.join()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def _payload(
         self,
         *,
         level: str,
@@ -35,9 +115,9 @@ class StructuredLogger:
         retries: int = 0,
         fallback_used: bool = False,
         **extra: Any,
-    ) -> None:
+    ) -> dict[str, Any] | None:
         if _level_to_int(level) < self._min_level:
-            return
+            return None
         payload: dict[str, Any] = {
             "timestamp": utc_now_iso(),
             "level": level.lower(),
@@ -54,9 +134,59 @@ class StructuredLogger:
             "fallback_used": fallback_used,
         }
         payload.update(extra)
+        return payload
+
+    def _write(self, payloads: list[dict[str, Any]]) -> None:
+        encode = _LINE_ENCODER.encode
+        lines = "".join(encode(payload) + "\n" for payload in payloads)
         with self._lock:
-            with self.path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, ensure_ascii=True) + "\n")
+            if self._fh is None:
+                self._fh = self.path.open("a", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE)
+            self._fh.write(lines)
+
+    def _writer_queue(self) -> queue.Queue[Any]:
+        q = self._queue
+        if q is None:
+            with self._queue_lock:
+                q = self._queue
+                if q is None:
+                    q = queue.Queue(maxsize=_ASYNC_QUEUE_SIZE)
+                    writer = Thread(target=self._drain, args=(q,), name="structured-logger", daemon=True)
+                    writer.start()
+                    self._queue, self._writer = q, writer
+        return q
+
+    def _drain(self, q: queue.Queue[Any]) -> None:
+        stop = False
+        while not stop:
+            batch: list[dict[str, Any]] = []
+            item = q.get()
+            while True:
+                if item is _STOP:
+                    stop = True
+                    q.task_done()
+                    break
+                batch.append(item)
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            try:
+                self._write(batch)
+            except OSError as exc:
+                # No file to log the failure to; surface it rather than lose it quietly.
+                print(
+                    f"structured-logger: failed to write {len(batch)} record(s) to {self.path}: {exc}",
+                    file=sys.stderr,
+                )
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def is_enabled(self, level: str) -> bool:
+        return _level_to_int(level) >= self._min_level
 
     def info(self, event: str, stage: str, **kwargs: Any) -> None:
         self.log(level="info", event=event, stage=stage, **kwargs)
@@ -67,6 +197,12 @@ class StructuredLogger:
     def error(self, event: str, stage: str, **kwargs: Any) -> None:
         self.log(level="error", event=event, stage=stage, status="error", **kwargs)
 
+    def async_info(self, event: str, stage: str, **kwargs: Any) -> None:
+        self.log_async(level="info", event=event, stage=stage, **kwargs)
+
+    def async_warning(self, event: str, stage: str, **kwargs: Any) -> None:
+        self.log_async(level="warning", event=event, stage=stage, **kwargs)
+
 
 def _level_to_int(level: str) -> int:
     mapping = {"debug": 10, "info": 20, "warning": 30, "error": 40}
@@ -81,11 +217,13 @@ def ensure_run_dir(out_dir: Path) -> Path:
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=True)
+        f.write(_PRETTY_ENCODER.encode(payload))
 
 
-def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
+def write_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> None:
+    """Write one JSON object per line, consuming ``rows`` lazily."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+        encode = _LINE_ENCODER.encode
         for row in rows:
-            f.write(json.dumps(row, ensure_ascii=True) + "\n")
+            f.write(encode(row) + "\n")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -22,13 +23,19 @@ from daily_movers.pipeline.agent import (
     _heuristic_analyst,
     _ensure_two_sentences,
     _extract_json,
+    _get_graph,
+    _initial_state,
     _normalise_action,
+    _run_linear,
     analyst_node,
     critic_node,
     recommender_node,
     researcher_node,
     run_agent_analysis,
+    run_agent_analysis_async,
+    run_agent_analysis_batch,
 )
+from daily_movers.pipeline.heuristics import analyze_with_heuristics
 from daily_movers.storage.runs import StructuredLogger
 
 
@@ -278,6 +285,21 @@ def test_full_agent_pipeline_heuristic_mode(tmp_path: Path) -> None:
     assert len(sentences) == 2
 
 
+def test_linear_executor_matches_compiled_graph(tmp_path: Path) -> None:
+    config = AppConfig(cache_dir=tmp_path / "cache", openai_api_key=None)
+    logger = _logger(tmp_path)
+
+    def _state() -> AgentState:
+        return _initial_state(row=_sample_row(), enrichment=_sample_enrichment(), config=config, run_logger=logger)
+
+    via_graph = _get_graph().invoke(_state())
+    via_linear = _run_linear(_state())
+
+    assert via_linear["analysis"] == via_graph["analysis"]
+    assert via_linear["recommendation_tags"] == via_graph["recommendation_tags"]
+    assert via_linear["model_used"] == via_graph["model_used"]
+
+
 def test_full_agent_pipeline_with_no_headlines(tmp_path: Path) -> None:
     row = TickerRow(
         ticker="XYZ",
@@ -319,6 +341,12 @@ def test_extract_json_from_markdown_wrapped() -> None:
     assert result["action"] == "SELL"
 
 
+def test_extract_json_from_prose_wrapped() -> None:
+    text = 'Here is the analysis: {"action": "WATCH", "rules": {"a": 1}} Hope this helps.'
+    assert _extract_json(text) == {"action": "WATCH", "rules": {"a": 1}}
+    assert _extract_json("no json here") == {}
+
+
 def test_normalise_action_fallback() -> None:
     assert _normalise_action("BUY", 0.5) == "BUY"
     assert _normalise_action("invalid", 0.5) == "BUY"
@@ -417,3 +445,164 @@ def test_agent_handles_eu_ticker(tmp_path: Path) -> None:
 
     analysis = run_agent_analysis(row=row, enrichment=enrichment, config=config, run_logger=logger)
     assert isinstance(analysis, Analysis)
+
+
+def test_batch_agent_analysis_packs_tickers_into_one_llm_call(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from daily_movers.pipeline import agent
+
+    calls: list[list[str]] = []
+
+    def fake_batch(*, api_key, model, base_url, timeout, items):  # noqa: ANN001
+        calls.append([item["ticker"] for item in items])
+        # The model "forgets" the second ticker; it must fall back per-ticker.
+        return {
+            "AAPL": {
+                "why_it_moved": "Apple rose on product news. Momentum looks constructive.",
+                "sentiment": 0.5,
+                "action": "BUY",
+                "confidence": 0.8,
+                "rules_triggered": ["positive_price_impulse"],
+                "explainability_summary": "Batch analysis.",
+            }
+        }
+
+    single_calls: list[str] = []
+
+    def fake_single(*, row, enrichment, config, run_logger):  # noqa: ANN001
+        single_calls.append(row.ticker)
+        return analyze_with_heuristics(row=row, enrichment=enrichment)
+
+    monkeypatch.setattr(agent, "_llm_analyst_batch", fake_batch)
+    monkeypatch.setattr(agent, "run_agent_analysis", fake_single)
+
+    rows = [_sample_row(), TickerRow(ticker="MSFT", pct_change=-1.0, ingestion_source="fixture")]
+    config = AppConfig(cache_dir=tmp_path / "cache", openai_api_key="sk-test")
+
+    results = run_agent_analysis_batch(
+        rows=rows,
+        enrichments=[_sample_enrichment(), Enrichment()],
+        config=config,
+        run_logger=_logger(tmp_path),
+    )
+
+    assert calls == [["AAPL", "MSFT"]]
+    assert single_calls == ["MSFT"]
+    assert results[0].action == Action.BUY
+    assert results[0].model_used == "langgraph:openai:gpt-4o-mini"
+    assert len(results) == 2
+
+
+def test_async_agent_analysis_matches_sync_in_heuristic_mode(tmp_path: Path) -> None:
+    config = AppConfig(cache_dir=tmp_path / "cache")
+    logger = _logger(tmp_path)
+
+    async def _run_all() -> list[Analysis]:
+        semaphore = asyncio.Semaphore(2)
+        return await asyncio.gather(
+            *(
+                run_agent_analysis_async(
+                    row=_sample_row(),
+                    enrichment=_sample_enrichment(),
+                    config=config,
+                    run_logger=logger,
+                    semaphore=semaphore,
+                )
+                for _ in range(3)
+            )
+        )
+
+    results = asyncio.run(_run_all())
+    expected = run_agent_analysis(
+        row=_sample_row(),
+        enrichment=_sample_enrichment(),
+        config=config,
+        run_logger=logger,
+    )
+
+    assert [r.model_dump() for r in results] == [expected.model_dump()] * 3
+
+
+def test_analyst_cache_returns_independent_copies() -> None:
+    from daily_movers.pipeline.llm_cache import AnalystResponseCache
+
+    cache = AnalystResponseCache(max_entries=1)
+    key = cache.key("gpt-4o-mini", "", "system", "Analyze AAPL.")
+    cache.put(key, {"action": "watch", "rules_triggered": ["x"]})
+
+    hit = cache.get(key)
+    assert hit == {"action": "watch", "rules_triggered": ["x"]}
+    hit["rules_triggered"].append("mutated")
+    assert cache.get(key)["rules_triggered"] == ["x"]
+
+    cache.put(cache.key("other"), {})
+    assert cache.get(key) is None
+
+
+def test_async_log_records_land_after_flush(tmp_path: Path) -> None:
+    logger = _logger(tmp_path)
+
+    for idx in range(50):
+        logger.async_info("agent_analysis_completed", stage="agent", symbol=f"T{idx}")
+    logger.flush()
+
+    lines = [json.loads(line) for line in logger.path.read_text(encoding="utf-8").splitlines()]
+    assert [line["symbol"] for line in lines] == [f"T{idx}" for idx in range(50)]
+    assert all(line["event"] == "agent_analysis_completed" for line in lines)
+
+
+def test_logger_close_stops_async_writer_thread(tmp_path: Path) -> None:
+    logger = _logger(tmp_path)
+    logger.async_info("agent_analysis_completed", stage="agent", symbol="AAA")
+    writer = logger._writer
+    logger.close()
+
+    assert writer is not None and not writer.is_alive()
+    assert json.loads(logger.path.read_text(encoding="utf-8"))["symbol"] == "AAA"
+
+
+def test_confident_analyst_output_skips_retry_routing() -> None:
+    from daily_movers.pipeline.agent import _analyst_to_critic_or_end
+
+    assert _analyst_to_critic_or_end({"analyst_output": {"confidence": 0.6}}) == "finalize"
+    assert _analyst_to_critic_or_end({"analyst_output": {"confidence": 0.2}}) == "critic"
+    assert _analyst_to_critic_or_end({"analyst_output": {}}) == "end"
+
+
+def test_trusted_analysis_matches_validated_model(tmp_path: Path) -> None:
+    from daily_movers.pipeline.agent import _trusted_analysis
+
+    config = AppConfig(cache_dir=tmp_path / "cache", openai_api_key=None)
+    state = _run_linear(
+        _initial_state(row=_sample_row(), enrichment=_sample_enrichment(), config=config, run_logger=_logger(tmp_path))
+    )
+
+    trusted = _trusted_analysis(state["analysis"], model_used="langgraph:heuristics")
+    validated = Analysis.model_validate({**state["analysis"], "model_used": "langgraph:heuristics"})
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.action is Action(state["analysis"]["action"])
+
+
+def test_batch_sizes_share_one_cached_chat_client(monkeypatch) -> None:
+    from langchain_core.messages import AIMessage
+    from langchain_openai import ChatOpenAI
+
+    from daily_movers.pipeline import agent
+
+    seen_max_tokens: list[int] = []
+
+    def fake_invoke(self, messages, config=None, **kwargs):  # noqa: ANN001, ANN003
+        seen_max_tokens.append(kwargs["max_tokens"])
+        return AIMessage(content="{}")
+
+    monkeypatch.setattr(ChatOpenAI, "invoke", fake_invoke)
+    monkeypatch.setattr(agent, "_chat_models", type(agent._chat_models)())
+    item = {"ticker": "AAPL", "evidence_summary": "", "numeric_signals": {}, "headlines": []}
+    settings = {"api_key": "sk-test", "model": "gpt-4o-mini", "base_url": "https://api.openai.com/v1", "timeout": 5}
+
+    agent._llm_analyst_batch(items=[item], **settings)
+    agent._llm_analyst_batch(items=[item, {**item, "ticker": "MSFT"}], **settings)
+
+    assert seen_max_tokens == [agent._BATCH_MAX_TOKENS_PER_TICKER, 2 * agent._BATCH_MAX_TOKENS_PER_TICKER]
+    assert len(agent._chat_models) == 1
+    assert not any("sk-test" in str(part) for key in agent._chat_models for part in key)
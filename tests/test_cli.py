@@ -8,7 +8,7 @@ from daily_movers.models import RunArtifacts
 def test_cli_auto_opens_digest_by_default(tmp_path: Path, monkeypatch) -> None:
     import daily_movers.cli as cli
 
-    opened: dict[str, str] = {}
+    opened: dict[str, Path] = {}
     digest = tmp_path / "digest.html"
     digest.write_text("<html><body>ok</body></html>", encoding="utf-8")
 
@@ -19,13 +19,12 @@ def test_cli_auto_opens_digest_by_default(tmp_path: Path, monkeypatch) -> None:
             paths={"digest_html": str(digest)},
         )
 
-    def fake_open(url: str, new: int = 0) -> bool:
-        opened["url"] = url
-        return True
+    def fake_launch(path: Path) -> None:
+        opened["path"] = path
 
     monkeypatch.setattr(cli, "run_daily_movers", fake_run_daily_movers)
     monkeypatch.setattr(cli, "load_config", lambda: object())
-    monkeypatch.setattr(cli.webbrowser, "open", fake_open)
+    monkeypatch.setattr(cli, "_launch_default_app", fake_launch)
 
     exit_code = cli.main(
         [
@@ -44,6 +43,28 @@ def test_cli_auto_opens_digest_by_default(tmp_path: Path, monkeypatch) -> None:
     )
 
     assert exit_code == 0
+    assert opened["path"] == digest
+
+
+def test_cli_falls_back_to_webbrowser_without_os_opener(tmp_path: Path, monkeypatch) -> None:
+    import daily_movers.cli as cli
+
+    opened: dict[str, str] = {}
+    digest = tmp_path / "digest.html"
+    digest.write_text("<html><body>ok</body></html>", encoding="utf-8")
+
+    def fake_launch(path: Path) -> None:
+        raise FileNotFoundError("xdg-open")
+
+    def fake_open(url: str, new: int = 0) -> bool:
+        opened["url"] = url
+        return True
+
+    monkeypatch.setattr(cli, "_launch_default_app", fake_launch)
+    monkeypatch.setattr("webbrowser.open", fake_open)
+
+    cli._open_digest_html(str(digest))
+
     assert opened["url"].startswith("file:")
 
 
@@ -61,13 +82,14 @@ def test_cli_no_open_flag_skips_auto_open(tmp_path: Path, monkeypatch) -> None:
             paths={"digest_html": str(digest)},
         )
 
-    def fake_open(url: str, new: int = 0) -> bool:
+    def fake_open(*args, **kwargs) -> bool:  # noqa: ANN002, ANN003
         called["open_called"] = True
         return True
 
     monkeypatch.setattr(cli, "run_daily_movers", fake_run_daily_movers)
     monkeypatch.setattr(cli, "load_config", lambda: object())
-    monkeypatch.setattr(cli.webbrowser, "open", fake_open)
+    monkeypatch.setattr(cli, "_launch_default_app", fake_open)
+    monkeypatch.setattr("webbrowser.open", fake_open)
 
     exit_code = cli.main(
         [
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from daily_movers.config import AppConfig, load_config
+
+
+def test_load_config_reuses_instance_until_env_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANALYSIS_MODEL=gpt-test\n", encoding="utf-8")
+    # setenv first so monkeypatch restores the variable that load_dotenv sets.
+    monkeypatch.setenv("ANALYSIS_MODEL", "")
+    monkeypatch.delenv("ANALYSIS_MODEL")
+    monkeypatch.setenv("MAX_WORKERS", "3")
+
+    first = load_config(env_file=str(env_file))
+    second = load_config(env_file=str(env_file))
+
+    assert first is second
+    assert first.analysis_model == "gpt-test"
+    assert first.max_workers == 3
+
+    monkeypatch.setenv("MAX_WORKERS", "7")
+    third = load_config(env_file=str(env_file))
+
+    assert third is not first
+    assert third.max_workers == 7
+
+
+def test_readiness_flags_follow_model_copy(tmp_path: Path) -> None:
+    config = AppConfig(cache_dir=tmp_path / "cache")
+    assert config.smtp_ready is False
+    assert config.openai_enabled is False
+
+    updated = config.model_copy(
+        update={
+            "smtp_username": "user",
+            "smtp_password": "pass",
+            "from_email": "from@example.com",
+            "self_email": "to@example.com",
+            "openai_api_key": "sk-test",
+        }
+    )
+
+    assert updated.smtp_ready is True
+    assert updated.openai_enabled is True
+    assert config.smtp_ready is False
+
+
+def test_config_cache_keys_do_not_hold_secrets(monkeypatch: pytest.MonkeyPatch) -> None:
+    from daily_movers import config as config_module
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-cache-key-secret")
+    cfg = load_config(env_file=None)
+
+    assert cfg.openai_api_key == "sk-cache-key-secret"
+    assert not any("sk-cache-key-secret" in key for key in config_module._config_cache)
@@ -44,6 +44,20 @@ def test_eml_backend_builds_and_writes_message(tmp_path: Path) -> None:
     assert "Content-Type: multipart/alternative" in payload
 
 
+def test_eml_backend_builds_one_message_per_recipient(tmp_path: Path) -> None:
+    backend = EmlBackend(logger=_logger(tmp_path))
+    messages = backend.build_messages(
+        subject="Digest",
+        html_body="<html><body>ok</body></html>",
+        from_email="from@example.com",
+        to_emails=["a@example.com", "b@example.com", "c@example.com"],
+    )
+
+    assert [m["To"] for m in messages] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert all(len(m.get_all("To")) == 1 for m in messages)
+    assert all(m["Subject"] == "Digest" for m in messages)
+
+
 def test_smtp_backend_requires_complete_config(tmp_path: Path) -> None:
     config = AppConfig(cache_dir=tmp_path / "cache")
     backend = SmtpBackend(config=config, logger=_logger(tmp_path))
@@ -96,8 +110,8 @@ def test_smtp_backend_falls_back_to_ssl_when_starttls_fails(tmp_path: Path, monk
         def send_message(self, message):
             state["smtp_ssl_sent"] = True
 
-    monkeypatch.setattr("daily_movers.email.smtp_backend.smtplib.SMTP", FakeSMTP)
-    monkeypatch.setattr("daily_movers.email.smtp_backend.smtplib.SMTP_SSL", FakeSMTPSSL)
+    monkeypatch.setattr("smtplib.SMTP", FakeSMTP)
+    monkeypatch.setattr("smtplib.SMTP_SSL", FakeSMTPSSL)
 
     config = AppConfig(
         cache_dir=tmp_path / "cache",
@@ -155,8 +169,8 @@ def test_smtp_backend_raises_typed_error_when_both_transports_fail(
         def send_message(self, message):
             return None
 
-    monkeypatch.setattr("daily_movers.email.smtp_backend.smtplib.SMTP", FakeSMTP)
-    monkeypatch.setattr("daily_movers.email.smtp_backend.smtplib.SMTP_SSL", FakeSMTPSSL)
+    monkeypatch.setattr("smtplib.SMTP", FakeSMTP)
+    monkeypatch.setattr("smtplib.SMTP_SSL", FakeSMTPSSL)
 
     config = AppConfig(
         cache_dir=tmp_path / "cache",
@@ -169,3 +183,101 @@ def test_smtp_backend_raises_typed_error_when_both_transports_fail(
 
     with pytest.raises(EmailDeliveryError):
         backend.send_message(message=_message())
+
+
+def test_smtp_backend_send_messages_reuses_one_connection(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = {"connections": 0, "logins": 0, "sent": 0}
+
+    class FakeSMTP:
+        def __init__(self, host, port, timeout):
+            state["connections"] += 1
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def ehlo(self):
+            return None
+
+        def starttls(self, context=None):
+            return None
+
+        def login(self, username, password):
+            state["logins"] += 1
+
+        def send_message(self, message):
+            state["sent"] += 1
+
+    monkeypatch.setattr("smtplib.SMTP", FakeSMTP)
+
+    config = AppConfig(
+        cache_dir=tmp_path / "cache",
+        smtp_username="user",
+        smtp_password="pass",
+        from_email="from@example.com",
+        self_email="to@example.com",
+    )
+    backend = SmtpBackend(config=config, logger=_logger(tmp_path))
+
+    backend.send_messages(messages=[_message(), _message(), _message()])
+
+    assert state == {"connections": 1, "logins": 1, "sent": 3}
+
+
+def test_smtp_backend_prefers_last_working_transport(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state = {"starttls_attempts": 0, "ssl_sent": 0}
+
+    class FakeSMTP:
+        def __init__(self, host, port, timeout):
+            state["starttls_attempts"] += 1
+            raise ConnectionRefusedError("no STARTTLS listener")
+
+    class FakeSMTPSSL:
+        def __init__(self, host, port, timeout, context):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def login(self, username, password):
+            return None
+
+        def send_message(self, message):
+            state["ssl_sent"] += 1
+
+    monkeypatch.setattr("smtplib.SMTP", FakeSMTP)
+    monkeypatch.setattr("smtplib.SMTP_SSL", FakeSMTPSSL)
+
+    config = AppConfig(
+        cache_dir=tmp_path / "cache",
+        smtp_username="user",
+        smtp_password="pass",
+        from_email="from@example.com",
+        self_email="to@example.com",
+    )
+    backend = SmtpBackend(config=config, logger=_logger(tmp_path))
+
+    backend.send_message(message=_message())
+    backend.send_message(message=_message())
+
+    assert state == {"starttls_attempts": 1, "ssl_sent": 2}
+
+
+def test_write_eml_file_removes_temp_file_when_serialisation_fails(tmp_path: Path, monkeypatch) -> None:
+    from daily_movers.render import eml
+
+    def failing_flatten(self, msg, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+        raise ValueError("boom")
+
+    monkeypatch.setattr(eml.BytesGenerator, "flatten", failing_flatten)
+    out_path = tmp_path / "digest.eml"
+
+    with pytest.raises(ValueError):
+        eml.write_eml_file(message=_message(), out_path=out_path)
+
+    assert list(tmp_path.iterdir()) == []
@@ -90,3 +90,77 @@ def test_golden_run_generates_all_artifacts(tmp_path: Path, monkeypatch) -> None
     run_meta = json.loads((out_dir / "run.json").read_text(encoding="utf-8"))
     assert run_meta["requested_date"] == "2026-02-08"
     assert run_meta["summary"]["processed"] == 2
+
+
+def test_run_without_archive_skips_archive_jsonl(tmp_path: Path, monkeypatch) -> None:
+    from daily_movers.pipeline import orchestrator
+
+    def fake_get_movers(*, region, source, top_n, client, logger):
+        return [TickerRow(ticker="AAPL", price=278.12, pct_change=0.80, volume=50_420_700, ingestion_source="fixture")]
+
+    monkeypatch.setattr(orchestrator, "get_movers", fake_get_movers)
+    monkeypatch.setattr(orchestrator, "enrich_ticker", lambda *, row, client, logger: Enrichment())
+
+    out_dir = tmp_path / "run"
+    request = RunRequest(date="2026-02-08", out_dir=str(out_dir), write_archive=False)
+    artifacts = run_daily_movers(request=request, config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key=None))
+
+    assert not (out_dir / "archive.jsonl").exists()
+    assert "archive_jsonl" not in artifacts.paths
+    assert (out_dir / "run.json").exists()
+
+
+def test_run_log_folds_per_ticker_info_into_one_record(tmp_path: Path, monkeypatch) -> None:
+    from daily_movers.pipeline import orchestrator
+
+    def fake_get_movers(*, region, source, top_n, client, logger):
+        return [
+            TickerRow(ticker=t, price=10.0, pct_change=pct, volume=1_000, ingestion_source="fixture")
+            for t, pct in (("AAA", 3.0), ("BBB", -2.0))
+        ]
+
+    monkeypatch.setattr(orchestrator, "get_movers", fake_get_movers)
+    monkeypatch.setattr(orchestrator, "enrich_ticker", lambda *, row, client, logger: Enrichment())
+
+    out_dir = tmp_path / "run"
+    run_daily_movers(
+        request=RunRequest(date="2026-02-08", out_dir=str(out_dir)),
+        config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key=None),
+    )
+
+    events = [json.loads(line)["event"] for line in (out_dir / "run.log").read_text(encoding="utf-8").splitlines()]
+    assert events[0] == "run_started" and events[-1] == "run_completed"
+    assert events.count("ticker_processed") == 2
+    assert "ticker_processing_started" not in events
+
+
+def test_timed_out_rows_stop_before_the_run_returns(tmp_path: Path, monkeypatch) -> None:
+    import time
+
+    from daily_movers.pipeline import orchestrator
+
+    def fake_get_movers(*, region, source, top_n, client, logger):
+        return [TickerRow(ticker="SLOW", price=10.0, pct_change=1.0, ingestion_source="fixture")]
+
+    def slow_enrich(*, row, client, logger):
+        time.sleep(0.2)
+        return Enrichment()
+
+    def timing_out(futures, timeout=None):
+        raise orchestrator.TimeoutError
+
+    monkeypatch.setattr(orchestrator, "get_movers", fake_get_movers)
+    monkeypatch.setattr(orchestrator, "enrich_ticker", slow_enrich)
+    monkeypatch.setattr(orchestrator, "as_completed", timing_out)
+
+    out_dir = tmp_path / "run"
+    artifacts = run_daily_movers(
+        request=RunRequest(date="2026-02-08", out_dir=str(out_dir)),
+        config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key=None),
+    )
+    log_after_run = (out_dir / "run.log").read_text(encoding="utf-8")
+    time.sleep(0.3)
+
+    assert artifacts.summary["needs_review"] == 1
+    assert "ticker_processed" not in log_after_run
+    assert (out_dir / "run.log").read_text(encoding="utf-8") == log_after_run
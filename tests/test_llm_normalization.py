@@ -44,12 +44,12 @@ def test_openai_response_normalization_accepts_variant_shapes(tmp_path: Path, mo
         "provenance_urls": ["https://example.com/raw-source"],
     }
 
-    def fake_post(url, headers, json, timeout):  # noqa: ANN001
+    def fake_post(self, url, headers, json, timeout):  # noqa: ANN001
         return _FakeResponse(200, {"output_text": json_module.dumps(payload)})
 
     # Keep a direct alias so the monkeypatched function can still serialize JSON.
     json_module = json
-    monkeypatch.setattr(llm.requests, "post", fake_post)
+    monkeypatch.setattr(llm.requests.Session, "post", fake_post)
 
     row = TickerRow(
         ticker="AAPL",
@@ -104,3 +104,110 @@ def test_safe_openai_error_redacts_key_text() -> None:
         },
     )
     assert llm._safe_openai_error(response) == "OpenAI authentication failed (invalid API key)"
+
+
+def test_extract_json_object_takes_first_complete_object_from_prose() -> None:
+    text = 'Here you go: {"action": "BUY", "note": "braces } in strings"} Let me know {if} needed.'
+
+    assert llm._extract_json_object(text) == {"action": "BUY", "note": "braces } in strings"}
+
+
+def test_synthesize_many_keeps_order_and_falls_back_per_ticker(tmp_path: Path, monkeypatch) -> None:
+    import asyncio
+
+    from daily_movers.errors import AnalysisError
+
+    analyzer = OpenAIAnalyzer(
+        config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key="sk-test-key"),
+        logger=StructuredLogger(path=tmp_path / "run.log", run_id="llm-test"),
+    )
+    rows = [
+        TickerRow(ticker=t, ingestion_source="fixture", pct_change=2.0, price=10.0) for t in ("AAA", "BBB", "CCC")
+    ]
+    enrichments = [Enrichment() for _ in rows]
+
+    def fake_synthesize(*, row: TickerRow, enrichment: Enrichment):  # noqa: ANN202
+        if row.ticker == "BBB":
+            raise AnalysisError("boom", stage="analysis", url=None)
+        analysis = llm.analyze_with_heuristics(row=row, enrichment=enrichment)
+        analysis.model_used = "openai:fake"
+        return analysis
+
+    monkeypatch.setattr(analyzer, "synthesize", fake_synthesize)
+
+    results = asyncio.run(analyzer.synthesize_many(rows=rows, enrichments=enrichments, max_concurrency=2))
+
+    assert [r.model_used for r in results] == ["openai:fake", "heuristics", "openai:fake"]
+    assert "AAA" in results[0].why_it_moved and "CCC" in results[2].why_it_moved
+
+
+def test_synthesize_does_not_repeat_rejected_requests(tmp_path: Path, monkeypatch) -> None:
+    import pytest
+
+    from daily_movers.errors import AnalysisError
+
+    calls: list[str] = []
+
+    def fake_post(self, url, headers, json, timeout):  # noqa: ANN001
+        calls.append(url)
+        return _FakeResponse(401, {"error": {"message": "Incorrect API key provided: sk-***"}})
+
+    monkeypatch.setattr(llm.requests.Session, "post", fake_post)
+    analyzer = OpenAIAnalyzer(
+        config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key="sk-test-key"),
+        logger=StructuredLogger(path=tmp_path / "run.log", run_id="llm-test"),
+    )
+
+    with pytest.raises(AnalysisError, match="invalid API key"):
+        analyzer.synthesize(row=TickerRow(ticker="AAPL", ingestion_source="fixture"), enrichment=Enrichment())
+
+    assert len(calls) == 1
+
+
+def test_invalid_api_key_short_circuits_later_tickers(tmp_path: Path, monkeypatch) -> None:
+    import pytest
+
+    from daily_movers.errors import AnalysisError
+
+    calls: list[str] = []
+
+    def fake_post(self, url, headers, json, timeout):  # noqa: ANN001
+        calls.append(url)
+        return _FakeResponse(401, {"error": {"message": "Incorrect API key provided: sk-***", "code": "invalid_api_key"}})
+
+    monkeypatch.setattr(llm.requests.Session, "post", fake_post)
+    logger = StructuredLogger(path=tmp_path / "run.log", run_id="llm-test")
+    analyzer = OpenAIAnalyzer(
+        config=AppConfig(cache_dir=tmp_path / "cache", openai_api_key="sk-test-key"),
+        logger=logger,
+    )
+
+    for ticker in ("AAPL", "MSFT"):
+        with pytest.raises(AnalysisError, match="invalid API key"):
+            analyzer.synthesize(row=TickerRow(ticker=ticker, ingestion_source="fixture"), enrichment=Enrichment())
+    logger.close()
+
+    assert len(calls) == 1
+    events = [json.loads(line)["event"] for line in logger.path.read_text(encoding="utf-8").splitlines()]
+    assert events == ["openai_auth_failed"]
+
+
+def test_transport_retries_are_logged(tmp_path: Path) -> None:
+    from urllib3.response import HTTPResponse
+
+    logger = StructuredLogger(path=tmp_path / "run.log", run_id="llm-test")
+    retry = llm._HTTP_RETRY.new(logger=logger)
+
+    retry = retry.increment(
+        method="POST",
+        url="/v1/responses",
+        response=HTTPResponse(body=b"", status=503, headers={"Retry-After": "2"}),
+    )
+    logger.close()
+
+    assert isinstance(retry, llm._LoggedRetry) and retry.logger is logger
+    record = json.loads(logger.path.read_text(encoding="utf-8"))
+    assert record["event"] == "openai_synthesis_retry"
+    assert record["error_message"] == "HTTP 503"
+    assert record["retry_after"] == 2
+    assert record["retries"] == 1
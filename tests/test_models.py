@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from daily_movers.models import (
@@ -11,6 +13,8 @@ from daily_movers.models import (
     ReportRow,
     TickerRow,
     apply_hitl_rules,
+    batch_timestamp,
+    utc_now_iso,
 )
 
 
@@ -93,3 +97,110 @@ def test_analysis_validation_rejects_out_of_range_values() -> None:
             ),
             provenance_urls=[],
         )
+
+
+def test_batch_timestamp_shares_created_at_within_block() -> None:
+    def _row() -> ReportRow:
+        return ReportRow(
+            ticker=TickerRow(ticker="AAPL", ingestion_source="test"),
+            enrichment=Enrichment(),
+            analysis=_base_analysis(),
+        )
+
+    with batch_timestamp("2026-02-08T00:00:00+00:00") as stamp:
+        rows = [_row(), _row()]
+
+    assert [r.created_at for r in rows] == [stamp, stamp]
+    assert _row().created_at != stamp
+
+
+def test_batch_timestamp_is_isolated_between_concurrent_runs() -> None:
+    import threading
+
+    inside = threading.Barrier(2)
+    stamps: dict[str, str] = {}
+
+    def run(stamp: str) -> None:
+        with batch_timestamp(stamp):
+            inside.wait()
+            row = ReportRow.build_trusted(
+                ticker=TickerRow(ticker="AAPL", ingestion_source="test"),
+                enrichment=Enrichment(),
+                analysis=_base_analysis(),
+            )
+            inside.wait()
+        stamps[stamp] = row.created_at
+
+    threads = [threading.Thread(target=run, args=(f"2026-02-0{d}T00:00:00+00:00",)) for d in (1, 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert stamps == {s: s for s in stamps} and len(stamps) == 2
+
+
+def test_ticker_row_normalises_and_rejects_blank_ticker() -> None:
+    assert TickerRow(ticker="  aapl ", ingestion_source="test").ticker == "AAPL"
+    with pytest.raises(Exception):
+        TickerRow(ticker="   ", ingestion_source="test")
+
+
+def test_apply_hitl_rules_merges_prior_reasons_in_sorted_order() -> None:
+    row = ReportRow(
+        ticker=TickerRow(ticker="AAPL", ingestion_source="test", ingestion_fallback_used=True),
+        enrichment=Enrichment(headlines=[]),
+        analysis=_base_analysis(confidence=0.6),
+        needs_review_reason=["processing_exception", "missing_headlines"],
+    )
+
+    flagged = apply_hitl_rules(row)
+
+    assert flagged.needs_review_reason == [
+        "confidence_below_threshold",
+        "ingestion_fallback_used",
+        "missing_headlines",
+        "processing_exception",
+    ]
+
+
+def test_utc_now_iso_matches_datetime_isoformat() -> None:
+    before = datetime.now(timezone.utc)
+    stamp = utc_now_iso()
+    after = datetime.now(timezone.utc)
+
+    parsed = datetime.fromisoformat(stamp)
+    assert parsed.utcoffset() == timedelta(0)
+    assert before - timedelta(milliseconds=1) <= parsed <= after + timedelta(milliseconds=1)
+    assert stamp.endswith("+00:00") and len(stamp) == len("2026-02-08T00:00:00.000000+00:00")
+
+
+def test_report_row_build_trusted_matches_validated_constructor() -> None:
+    kwargs = {
+        "ticker": TickerRow(ticker="AAPL", ingestion_source="test"),
+        "enrichment": Enrichment(),
+        "analysis": _base_analysis(),
+        "needs_review_reason": ["processing_timeout"],
+        "status": "partial",
+    }
+
+    with batch_timestamp():
+        trusted = ReportRow.build_trusted(**kwargs)
+        validated = ReportRow(**kwargs)
+
+    assert trusted.to_archive_dict() == validated.to_archive_dict()
+    assert trusted.needs_review_reason is not kwargs["needs_review_reason"]
+
+
+def test_to_flat_dict_reflects_trace_edits_made_after_flattening() -> None:
+    row = ReportRow(
+        ticker=TickerRow(ticker="AAPL", ingestion_source="test", pct_change=2.0),
+        enrichment=Enrichment(headlines=[]),
+        analysis=_base_analysis(),
+    )
+    assert row.to_flat_dict()["rules_triggered"] == "baseline_rule"
+
+    row.analysis.decision_trace.rules_triggered.append("openai_fallback_used")
+
+    assert row.to_flat_dict()["rules_triggered"] == "baseline_rule; openai_fallback_used"
+    assert row.model_copy().to_flat_dict()["rules_triggered"] == "baseline_rule; openai_fallback_used"
@@ -143,6 +143,6 @@ def test_optional_profile_fetch_failure_does_not_mark_enrichment_error(tmp_path:
 
     enrichment = enrich_ticker(row=row, client=client, logger=logger)
 
-    assert enrichment.errors == []
+    assert enrichment.errors == ()
     assert enrichment.headlines
     assert enrichment.price_series
@@ -55,6 +55,23 @@ def test_uipath_adapter_success_coerces_and_forwards(monkeypatch: pytest.MonkeyP
     assert req.out_dir == out_dir
 
 
+def test_uipath_adapter_keeps_out_dir_verbatim(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from daily_movers.adapters import uipath
+
+    captured = {}
+
+    def fake_run_pipeline(*, request, config):  # noqa: ANN001
+        captured["out_dir"] = request.out_dir
+        return RunArtifacts(status="success", summary={}, paths={})
+
+    monkeypatch.setattr(uipath, "run_pipeline", fake_run_pipeline)
+
+    out_dir = f" {tmp_path / 'out'} "
+    result = uipath.run_daily_movers(out_dir, mode=" Movers ", region=" US ")
+    assert result["status"] == "success"
+    assert captured["out_dir"] == out_dir
+
+
 def test_uipath_adapter_rejects_unknown_kwargs(tmp_path: Path) -> None:
     from daily_movers.adapters import uipath
 
@@ -86,6 +103,20 @@ def test_uipath_adapter_watchlist_must_exist(tmp_path: Path) -> None:
     assert "watchlist path not found" in result["summary"]["error_message"]
 
 
+def test_uipath_adapter_accepts_watchlist_created_after_miss(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from daily_movers.adapters import uipath
+
+    monkeypatch.setattr(uipath, "run_pipeline", lambda **_: RunArtifacts(status="success", summary={}, paths={}))
+    watchlist = tmp_path / "late.yaml"
+
+    first = uipath.run_daily_movers(str(tmp_path / "out"), mode="watchlist", watchlist=str(watchlist))
+    assert first["status"] == "failed"
+
+    watchlist.write_text("tickers: [AAPL]\n", encoding="utf-8")
+    second = uipath.run_daily_movers(str(tmp_path / "out"), mode="watchlist", watchlist=str(watchlist))
+    assert second["status"] == "success"
+
+
 def test_uipath_adapter_invalid_region_fails(tmp_path: Path) -> None:
     from daily_movers.adapters import uipath
 
@@ -108,6 +139,17 @@ def test_uipath_adapter_invalid_date_fails(tmp_path: Path) -> None:
     assert "date must be a YYYY-MM-DD" in result["summary"]["error_message"]
 
 
+def test_uipath_adapter_rejects_non_ascii_digit_date(tmp_path: Path) -> None:
+    from daily_movers.adapters import uipath
+
+    result = uipath.run_daily_movers(
+        str(tmp_path / "out"),
+        date="\uff12\uff10\uff12\uff16-\uff10\uff11-\uff10\uff15",
+    )
+    assert result["status"] == "failed"
+    assert "date must be a YYYY-MM-DD" in result["summary"]["error_message"]
+
+
 def test_uipath_adapter_send_email_string_true(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     from daily_movers.adapters import uipath
 
@@ -122,3 +164,53 @@ def test_uipath_adapter_send_email_string_true(monkeypatch: pytest.MonkeyPatch,
     result = uipath.run_daily_movers(str(tmp_path / "out"), send_email="1")
     assert result["status"] == "success"
     assert captured["send_email"] is True
+
+
+def test_uipath_batch_loads_config_once_and_keeps_order(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from daily_movers.adapters import uipath
+
+    config_loads: list[int] = []
+    regions: list[str] = []
+    sentinel_config = object()
+
+    def fake_load_config() -> object:
+        config_loads.append(1)
+        return sentinel_config
+
+    def fake_run_pipeline(*, request, config):  # noqa: ANN001
+        assert config is sentinel_config
+        regions.append(request.region)
+        return RunArtifacts(status="success", summary={"region": request.region}, paths={})
+
+    monkeypatch.setattr(uipath, "load_config", fake_load_config)
+    monkeypatch.setattr(uipath, "run_pipeline", fake_run_pipeline)
+
+    results = uipath.run_daily_movers_batch(
+        [
+            {"out_dir": str(tmp_path / "us"), "region": "us", "top": "3"},
+            {"out_dir": str(tmp_path / "mars"), "region": "mars"},
+            {"out_dir": str(tmp_path / "uk"), "region": "UK"},
+        ]
+    )
+
+    assert len(config_loads) == 1
+    assert regions == ["us", "uk"]
+    assert [r["status"] for r in results] == ["success", "failed", "success"]
+    assert "region must be one of" in results[1]["summary"]["error_message"]
+
+
+def test_uipath_batch_rejects_unknown_keys_before_running(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from daily_movers.adapters import uipath
+
+    def fake_run_pipeline(*, request, config):  # noqa: ANN001
+        raise AssertionError("pipeline must not run for a malformed batch")
+
+    monkeypatch.setattr(uipath, "run_pipeline", fake_run_pipeline)
+
+    with pytest.raises(TypeError):
+        uipath.run_daily_movers_batch(
+            [
+                {"out_dir": str(tmp_path / "a")},
+                {"out_dir": str(tmp_path / "b"), "banana": 123},
+            ]
+        )